@@ -0,0 +1,214 @@
+import os
+import queue
+import threading
+import pygame
+from settings import IMG_DIR, SND_DIR, SCREEN_WIDTH, SCREEN_HEIGHT, BAKED_ASSETS
+from bake import BakedImages
+
+# Tabela de imagens: chave -> (arquivo, tamanho final, usa alpha)
+IMAGES = {
+    "player": ("player.png", (40, 40), True),
+    "platform_normal": ("platform_green.png", (70, 20), True),
+    "platform_moving": ("platform_blue_moving.png", (70, 20), True),
+    "platform_breaking_1": ("platform_brown_breaking_1.png", (70, 20), True),
+    "platform_breaking_2": ("platform_brown_breaking_2.png", (70, 20), True),
+    "spring": ("spring.png", (20, 20), True),
+    "jetpack": ("jetpack.png", (30, 30), True),
+    "enemy_fly": ("enemy_fly.png", (30, 20), True),
+    "background": ("background.png", (SCREEN_WIDTH, SCREEN_HEIGHT), False),
+    "menu_background": ("background2.png", (SCREEN_WIDTH, SCREEN_HEIGHT), False),
+}
+
+# Tabela de sons: chave -> (arquivo, volume)
+SOUNDS = {
+    "jump": ("jump.wav", 0.3),
+    "platform_break": ("platform_break.wav", 0.4),
+    "powerup_pickup": ("powerup_pickup.wav", 0.5),
+    "game_over": ("game_over.wav", 0.6),
+    "menu_hover": ("menu_hover.wav", 0.2),
+}
+
+# Sons que podem faltar (ficam mudos)
+OPTIONAL_SOUNDS = {"menu_hover"}
+
+
+class SilentSound:
+    """Substituto de pygame.mixer.Sound quando o mixer não está ativo (modo headless)"""
+
+    def play(self, *args, **kwargs) -> None:
+        return None
+
+    def stop(self) -> None:
+        pass
+
+    def set_volume(self, volume: float) -> None:
+        pass
+
+
+def _enemy_fallback(size: tuple) -> pygame.Surface:
+    """Imagem usada caso enemy_fly.png não exista"""
+    image = pygame.Surface(size)
+    image.fill((255, 0, 0))
+    pygame.draw.circle(image, (0, 0, 0), (size[0] // 2, size[1] // 2), 4)
+    return image
+
+
+# Imagens que podem faltar: chave -> função que gera um substituto (ou None)
+FALLBACKS = {
+    "enemy_fly": _enemy_fallback,
+    "menu_background": None,
+}
+
+
+class AssetManager:
+    """Registro central de imagens e sons, carregados e redimensionados uma única vez"""
+
+    def __init__(self) -> None:
+        self.images = {}
+        self.sounds = {}
+        self.loaded = False
+        # Quantas vezes fomos ao disco (total e depois do carregamento inicial)
+        self.load_count = 0
+        self.late_load_count = 0
+        # Carregamento em segundo plano (ver start_loading/poll)
+        self.pending = None
+        self.thread = None
+        self.total = 0
+        self.done = 0
+        # Cache de imagens prontas (ver bake.py), aberto no início do carregamento
+        self.baked_path = BAKED_ASSETS
+        self.baked = None
+
+    def load_all(self) -> None:
+        """Carrega todas as imagens e sons da tabela. Chamar depois de set_mode."""
+        self._open_baked()
+        for key in IMAGES:
+            if key not in self.images:
+                self.images[key] = self._load_image(key)
+        for key in SOUNDS:
+            if key not in self.sounds:
+                self.sounds[key] = self._load_sound(key)
+        self.loaded = True
+
+    def start_loading(self) -> None:
+        """Começa a decodificar e redimensionar tudo numa thread separada.
+
+        A conversão para o formato da tela (convert) precisa da thread
+        principal e é feita por poll(), chamado a cada quadro da tela de
+        carregamento.
+        """
+        self._open_baked()
+        jobs = [("image", key) for key in IMAGES if key not in self.images]
+        jobs += [("sound", key) for key in SOUNDS if key not in self.sounds]
+        self.pending = queue.SimpleQueue()
+        self.total = len(jobs)
+        self.done = 0
+        self.thread = threading.Thread(target=self._worker, args=(jobs,), name="asset-loader", daemon=True)
+        self.thread.start()
+
+    def _worker(self, jobs: list) -> None:
+        for kind, key in jobs:
+            try:
+                item = self._decode_image(key) if kind == "image" else self._load_sound(key)
+            except Exception as error:  # Repassado para a thread principal em poll()
+                item = error
+            self.pending.put((kind, key, item))
+
+    def poll(self) -> float:
+        """Finaliza o que a thread já carregou e retorna o progresso (0 a 1)"""
+        if self.pending is None:
+            return 1.0 if self.loaded else 0.0
+        while True:
+            try:
+                kind, key, item = self.pending.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, Exception):
+                raise item
+            if kind == "image":
+                self.images[key] = self._convert(key, item)
+            else:
+                self.sounds[key] = item
+            self.done += 1
+        if self.done >= self.total:
+            self.pending = None
+            self.loaded = True
+            return 1.0
+        return self.done / self.total
+
+    def wait(self, timeout: float) -> None:
+        """Espera a thread de carregamento terminar, por no máximo timeout segundos"""
+        if self.thread is not None:
+            self.thread.join(timeout)
+
+    def image(self, key: str) -> pygame.Surface:
+        """Retorna a superfície compartilhada da chave (não modificar!)"""
+        try:
+            return self.images[key]
+        except KeyError:
+            # Carregamento tardio: funciona, mas fica registrado no contador
+            self.images[key] = self._load_image(key)
+            return self.images[key]
+
+    def sound(self, key: str) -> pygame.mixer.Sound:
+        try:
+            return self.sounds[key]
+        except KeyError:
+            self.sounds[key] = self._load_sound(key)
+            return self.sounds[key]
+
+    def _count_load(self) -> None:
+        self.load_count += 1
+        if self.loaded:
+            self.late_load_count += 1
+
+    def _open_baked(self) -> None:
+        if self.baked is None and self.baked_path:
+            self.baked = BakedImages(self.baked_path)
+
+    def _load_image(self, key: str):
+        return self._convert(key, self._decode_image(key))
+
+    def _decode_image(self, key: str):
+        """Lê e redimensiona a imagem (pode rodar fora da thread principal)"""
+        file_name, size, alpha = IMAGES[key]
+        self._count_load()
+        path = os.path.join(IMG_DIR, file_name)
+        # Do cache, se ele tem esta imagem a partir do mesmo PNG; senão decodifica
+        if self.baked is not None:
+            image = self.baked.surface(key, path, size)
+            if image is not None:
+                return image
+        try:
+            image = pygame.image.load(path)
+        except (pygame.error, FileNotFoundError):
+            if key not in FALLBACKS:
+                raise
+            fallback = FALLBACKS[key]
+            return fallback(size) if fallback else None
+        return pygame.transform.scale(image, size)
+
+    def _convert(self, key: str, image):
+        """Converte para o formato da tela (só na thread principal)"""
+        # Sem janela (modo headless) não há formato de tela para converter
+        if image is None or pygame.display.get_surface() is None:
+            return image
+        return image.convert_alpha() if IMAGES[key][2] else image.convert()
+
+    def _load_sound(self, key: str) -> pygame.mixer.Sound:
+        file_name, volume = SOUNDS[key]
+        if not pygame.mixer.get_init():
+            return SilentSound()
+        self._count_load()
+        try:
+            sound = pygame.mixer.Sound(os.path.join(SND_DIR, file_name))
+        except (pygame.error, FileNotFoundError):
+            if key not in OPTIONAL_SOUNDS:
+                raise
+            return SilentSound()
+        sound.set_volume(volume)
+        return sound
+
+
+# Instância única usada pelo jogo todo
+assets = AssetManager()
@@ -0,0 +1,51 @@
+import pygame
+
+# Toda a arte desenhada pelos sprites da partida (chaves de assets.IMAGES)
+ATLAS_KEYS = ("player", "platform_normal", "platform_moving", "platform_breaking_1",
+              "platform_breaking_2", "spring", "jetpack", "enemy_fly")
+
+
+def pack_shelves(sizes: dict, width: int, padding: int = 1) -> tuple:
+    """Empacota retângulos em prateleiras (shelf packing).
+
+    Os maiores (em altura) vêm primeiro; cada prateleira é preenchida da
+    esquerda para a direita e uma nova começa quando a largura acaba.
+    Retorna ({chave: Rect}, altura total).
+    """
+    areas = {}
+    x = y = shelf = 0
+    for key in sorted(sizes, key=lambda k: (-sizes[k][1], -sizes[k][0], k)):
+        w, h = sizes[key]
+        if x and x + w > width:
+            y += shelf + padding
+            x = shelf = 0
+        areas[key] = pygame.Rect(x, y, w, h)
+        x += w + padding
+        shelf = max(shelf, h)
+    return areas, y + shelf
+
+
+class TextureAtlas:
+    """Uma superfície convertida com toda a arte dos sprites.
+
+    areas leva a superfície original de cada imagem (a mesma compartilhada
+    pelos sprites, vinda de assets.image) à sua área no atlas, então o
+    desenho vira um único blits() de (atlas, destino, área). O atlas é
+    codificado em RLE: o SDL pula as faixas transparentes em vez de
+    misturar pixel a pixel, o que deixa os blits mais rápidos que os das
+    imagens soltas. Precisa de uma janela (convert_alpha) e não deve ser
+    travado (lock) depois de pronto, senão o RLE é desfeito.
+    """
+
+    def __init__(self, images: dict, width: int = 256, padding: int = 1) -> None:
+        sizes = {key: image.get_size() for key, image in images.items()}
+        width = max([width] + [w for w, _ in sizes.values()])
+        self.keys, height = pack_shelves(sizes, width, padding)
+        self.surface = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+        self.surface.fill((0, 0, 0, 0))
+        self.areas = {}
+        for key, image in images.items():
+            # MAX sobre o fundo zerado copia RGBA exato (um blit normal misturaria o alpha)
+            self.surface.blit(image, self.keys[key], special_flags=pygame.BLEND_RGBA_MAX)
+            self.areas[image] = self.keys[key]
+        self.surface.set_alpha(255, pygame.RLEACCEL)
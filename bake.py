@@ -0,0 +1,148 @@
+"""Cache de imagens já prontas, para a inicialização não decodificar PNG.
+
+`python bake.py` decodifica cada imagem de assets.IMAGES, redimensiona para
+o tamanho final e grava os pixels crus num arquivo só (BAKED_ASSETS), em
+BGRA de 32 bits: o mesmo formato que convert_alpha() produz nas telas de 32
+bits, então a conversão na inicialização é só uma cópia. Cada entrada guarda
+o hash (SHA-1) do PNG de origem e o tamanho final.
+
+Na inicialização o AssetManager mapeia o arquivo na memória (mmap) e cria as
+superfícies direto dos bytes com pygame.image.frombuffer. Uma entrada vale
+só se o hash do PNG e o tamanho da tabela batem; senão (PNG editado, tamanho
+mudado, arquivo de outra versão ou ausente) a imagem vem do PNG como antes.
+Basta rodar o bake de novo.
+
+Exemplos:
+
+    python bake.py
+    python bake.py --check          # só lista as entradas desatualizadas (falha se não há cache)
+    python bench.py --no-baked      # inicialização a frio sem o cache, para comparar
+"""
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+
+import pygame
+
+MAGIC = b"DJBK"
+VERSION = 1
+HEADER = struct.Struct("<4sBH")  # assinatura, versão, número de entradas
+ENTRY = struct.Struct("<24s20sHHQI")  # chave, SHA-1 do PNG, largura, altura, posição, bytes
+PIXEL_FORMAT = "BGRA"  # ARGB8888 em little-endian, o formato de convert_alpha()
+ALIGN = 64  # Cada imagem começa numa posição múltipla de 64
+
+
+def source_hash(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).digest()
+
+
+def write_cache(path: str, images: list) -> int:
+    """Grava [(chave, hash do PNG, superfície)] no cache e retorna o tamanho em bytes.
+
+    Escreve num arquivo temporário e troca no fim, então um jogo abrindo ao
+    mesmo tempo vê o cache antigo ou o novo, nunca um pela metade.
+    """
+    entries = []
+    blobs = []
+    offset = HEADER.size + ENTRY.size * len(images)
+    for key, digest, surface in images:
+        data = pygame.image.tobytes(surface, PIXEL_FORMAT)
+        offset += -offset % ALIGN
+        width, height = surface.get_size()
+        entries.append(ENTRY.pack(key.encode(), digest, width, height, offset, len(data)))
+        blobs.append((offset, data))
+        offset += len(data)
+
+    temp = path + ".tmp"
+    with open(temp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(entries)))
+        f.write(b"".join(entries))
+        for start, data in blobs:
+            f.write(b"\0" * (start - f.tell()))
+            f.write(data)
+    os.replace(temp, path)
+    return offset
+
+
+class BakedImages:
+    """Cache aberto com mmap; surface() devolve a imagem pronta ou None se a entrada não vale.
+
+    As superfícies apontam para o mapeamento (cópia na escrita, então
+    alterá-las não mexe no arquivo); ele fica aberto enquanto o objeto existir.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.map = None
+        self.entries = {}  # chave -> (hash, tamanho, posição, bytes)
+        # Estatísticas
+        self.hits = 0
+        self.stale = []
+        try:
+            with open(path, "rb") as f:
+                self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            magic, version, count = HEADER.unpack_from(self.map)
+        except (OSError, ValueError, struct.error):  # Sem cache, vazio ou truncado
+            self.map = None
+            return
+        if magic != MAGIC or version != VERSION:
+            return
+        for i in range(count):
+            key, digest, width, height, offset, length = ENTRY.unpack_from(self.map, HEADER.size + i * ENTRY.size)
+            self.entries[key.rstrip(b"\0").decode()] = (digest, (width, height), offset, length)
+
+    def surface(self, key: str, source: str, size: tuple) -> pygame.Surface:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        digest, baked_size, offset, length = entry
+        try:
+            fresh = source_hash(source) == digest
+        except OSError:
+            fresh = False
+        if (not fresh or baked_size != tuple(size) or length != size[0] * size[1] * 4
+                or offset + length > len(self.map)):
+            self.stale.append(key)
+            return None
+        self.hits += 1
+        return pygame.image.frombuffer(memoryview(self.map)[offset:offset + length], size, PIXEL_FORMAT)
+
+
+def main() -> None:
+    from settings import BAKED_ASSETS, IMG_DIR
+    from assets import IMAGES, AssetManager
+
+    parser = argparse.ArgumentParser(description="Grava o cache de imagens prontas")
+    parser.add_argument("--output", default=BAKED_ASSETS, help="arquivo do cache")
+    parser.add_argument("--check", action="store_true", help="só verifica o cache existente")
+    args = parser.parse_args()
+
+    if args.check:
+        baked = BakedImages(args.output)
+        if baked.map is None:  # Sem arquivo (ou vazio): não há o que listar como desatualizado
+            raise SystemExit(f"cache ausente: {args.output}")
+        for key, (file_name, size, _) in IMAGES.items():
+            path = os.path.join(IMG_DIR, file_name)
+            if os.path.exists(path):
+                ok = baked.surface(key, path, size) is not None
+                print(f"{key:<20} {'ok' if ok else 'desatualizada'}")
+        return
+
+    # Decodifica pelo próprio AssetManager (sem o cache) para sair igual ao jogo
+    manager = AssetManager()
+    manager.baked_path = None
+    images = []
+    for key, (file_name, size, _) in IMAGES.items():
+        path = os.path.join(IMG_DIR, file_name)
+        if not os.path.exists(path):
+            continue  # Imagens opcionais ausentes continuam vindo dos substitutos
+        images.append((key, source_hash(path), manager._decode_image(key)))
+    total = write_cache(args.output, images)
+    print(f"{len(images)} imagens, {total / 1024:.0f} KB em {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,363 @@
+"""Benchmarks reproduzíveis da simulação e da renderização.
+
+Roda sem janela (drivers "dummy" do SDL para vídeo e áudio) uma série de
+cenários com roteiro fixo e semente fixa:
+
+  - climb:    subida normal com o bot de tune_levels.py;
+  - jetpack:  subida contínua com impulso de jetpack (boost 3.0);
+  - enemies:  tela cheia de FlyingEnemy;
+  - moving:   campo denso de MovingPlatform.
+
+Para cada cenário mede passos de simulação por segundo (update), quadros
+desenhados por segundo (draw), memória alocada por quadro (tracemalloc) e o
+tempo de preparação; mede também o tempo de inicialização do jogo (processo
+novo até o primeiro quadro). Compara com bench_baseline.json e termina com
+código 1 se algo piorou além da tolerância.
+
+Exemplos:
+
+    python bench.py
+    python bench.py --scenario climb --frames 2000
+    python bench.py --save-baseline
+    python bench.py --scenario enemies --no-atlas   # desenho sem o atlas de sprites
+    python bench.py --scenario climb --no-baked     # inicialização decodificando os PNGs (sem bake.py)
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+import movers
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_baseline.json")
+SEED = 1234
+ENEMY_COUNT = 40
+MOVING_COUNT = 60
+
+# Métricas comparadas com a baseline: nome -> True se maior é melhor
+METRICS = {
+    "update_per_s": True,
+    "draw_per_s": True,
+    "alloc_peak_kb": False,
+    "retained_b_per_frame": False,
+    "setup_ms": False,
+}
+# Medidas ao longo dos quadros da execução: só comparáveis com o mesmo --frames
+FRAME_METRICS = ("update_per_s", "draw_per_s", "alloc_peak_kb", "retained_b_per_frame")
+
+
+def climb_setup(game) -> None:
+    pass
+
+
+def climb_input(game) -> int:
+    from tune_levels import bot_policy
+    return bot_policy(game)
+
+
+def jetpack_setup(game) -> None:
+    game.player.jump(boost=3.0)
+
+
+def jetpack_input(game) -> int:
+    # Um novo impulso de jetpack sempre que a subida perde força
+    if game.player.vy > -5:
+        game.player.jump(boost=3.0)
+        game.player.powered_up = True
+    return 0
+
+
+def enemies_setup(game) -> None:
+    fill_enemies(game)
+
+
+def enemies_input(game) -> int:
+    # O jogador fica invulnerável (como depois de um power-up) para a partida
+    # não acabar; inimigos pisados são repostos
+    game.player.was_powered_up = True
+    fill_enemies(game)
+    return 0
+
+
+def fill_enemies(game) -> None:
+    level = game.level
+    rng = level.rng
+    while len(level.enemies) < ENEMY_COUNT:
+        x = rng.randint(40, SCREEN_WIDTH - 40)
+        y = level.camera.to_world_y(rng.randint(0, SCREEN_HEIGHT - 100))
+        enemy = level.pools["enemy"].acquire(x, y, rng)
+        level.all_sprites.add(enemy)
+        level.enemies.add(enemy)
+        level.add_mover(enemy, movers.KIND_ENEMY)
+
+
+def moving_setup(game) -> None:
+    fill_moving(game, 0, SCREEN_HEIGHT - 150)
+
+
+def moving_input(game) -> int:
+    # Repõe as plataformas que saíram por baixo logo acima da tela
+    fill_moving(game, -100, 0)
+    return 2 if (game.frame // 90) % 2 else 1
+
+
+def fill_moving(game, top: int, bottom: int) -> None:
+    level = game.level
+    rng = level.rng
+    count = sum(1 for p in level.platforms if p.type == "moving")
+    for _ in range(count, MOVING_COUNT):
+        x = rng.randrange(0, SCREEN_WIDTH - 70)
+        y = level.camera.to_world_y(rng.randint(top, bottom))
+        p = level.pools["moving"].acquire(x, y, rng)
+        level.all_sprites.add(p)
+        level.platforms.add(p)
+        level.add_mover(p, movers.KIND_PLATFORM)
+
+
+SCENARIOS = {
+    "climb": (climb_setup, climb_input),
+    "jetpack": (jetpack_setup, jetpack_input),
+    "enemies": (enemies_setup, enemies_input),
+    "moving": (moving_setup, moving_input),
+}
+
+
+def start(game, name: str, seed: int) -> float:
+    """Nova partida preparada para o cenário; retorna o tempo de preparação (s)"""
+    t = time.perf_counter()
+    game.reset(seed)
+    SCENARIOS[name][0](game)
+    return time.perf_counter() - t
+
+
+def time_update(game, name: str, frames: int) -> float:
+    """Tempo gasto só em step() ao longo de `frames` quadros"""
+    policy = SCENARIOS[name][1]
+    seed = SEED
+    start(game, name, seed)
+    spent = 0.0
+    for _ in range(frames):
+        inputs = policy(game)
+        t = time.perf_counter()
+        alive = game.step(inputs)
+        spent += time.perf_counter() - t
+        if not alive:
+            seed += 1
+            start(game, name, seed)
+    return spent
+
+
+def time_draw(game, name: str, frames: int) -> float:
+    """Tempo gasto só em draw() na mesma sequência de quadros"""
+    policy = SCENARIOS[name][1]
+    seed = SEED
+    start(game, name, seed)
+    drawn = 0.0
+    for _ in range(frames):
+        if not game.step(policy(game)):
+            seed += 1
+            start(game, name, seed)
+        t = time.perf_counter()
+        game.draw()
+        drawn += time.perf_counter() - t
+    return drawn
+
+
+def run_scenario(game, name: str, frames: int, repeat: int = 3) -> dict:
+    """Mede um cenário: update e draw em passes separados, depois memória.
+
+    Os tempos são o melhor de `repeat` execuções (o ruído da máquina só
+    deixa as medidas mais lentas, nunca mais rápidas).
+    """
+    policy = SCENARIOS[name][1]
+    setup = min(start(game, name, SEED) for _ in range(repeat))
+    spent = min(time_update(game, name, frames) for _ in range(repeat))
+    drawn = min(time_draw(game, name, frames) for _ in range(repeat))
+
+    # Memória: pico alocado dentro de cada quadro e o que sobra entre quadros
+    # (o que sobra inclui pools e dicionários ainda crescendo, não só vazamentos)
+    seed = SEED
+    start(game, name, seed)
+    for _ in range(60):  # Aquece pools e caches antes de medir
+        game.step(policy(game))
+        game.draw()
+    sample = max(60, frames // 5)
+    peaks = 0
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(sample):
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        if not game.step(policy(game)):
+            seed += 1
+            start(game, name, seed)
+        game.draw()
+        peaks += tracemalloc.get_traced_memory()[1] - current
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    return {
+        "update_per_s": round(frames / spent),
+        "draw_per_s": round(frames / drawn),
+        "alloc_peak_kb": round(peaks / sample / 1024, 2),
+        "retained_b_per_frame": round(retained / sample, 1),
+        "setup_ms": round(setup * 1000, 2),
+        "sprites": len(game.all_sprites),
+    }
+
+
+def make_game():
+    """Game com janela (drivers dummy) cujo placar fica só na memória.
+
+    O SQLite ":memory:" mantém o custo de abrir o placar na inicialização
+    sem criar scores.db na pasta do jogo.
+    """
+    import game
+    game.SCORES_DB = ":memory:"
+    return game.Game()
+
+
+def startup_probe(baked: bool = True) -> None:
+    """Executado num processo novo: inicialização até o primeiro quadro"""
+    t = time.perf_counter()
+    from assets import assets
+    if not baked:
+        assets.baked_path = None
+    game = make_game()
+    game.reset(SEED)
+    game.draw()
+    print(json.dumps(dict(game.startup, startup_ms=round((time.perf_counter() - t) * 1000, 1))))
+
+
+def measure_startup(repeat: int = 3, baked: bool = True) -> dict:
+    """Melhor de `repeat` inicializações a frio (ms): total até o primeiro
+    quadro da partida, primeira tela (carregamento) e jogo pronto"""
+    best = {}
+    command = [sys.executable, os.path.abspath(__file__), "--startup-probe"] + ([] if baked else ["--no-baked"])
+    for _ in range(repeat):
+        out = subprocess.run(command,
+                             capture_output=True, text=True, check=True).stdout
+        times = json.loads(out.strip().splitlines()[-1])
+        for name, ms in times.items():
+            best[name] = min(best.get(name, ms), ms)
+    return best
+
+
+def machine() -> dict:
+    return {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Lista de regressões (textos) em relação à baseline"""
+    regressions = []
+    same_frames = baseline.get("frames") == results["frames"]
+    for name, metrics in results["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            if metric not in base or (metric in FRAME_METRICS and not same_frames):
+                continue
+            old, new = base[metric], metrics[metric]
+            if higher_is_better:
+                bad = new < old * (1 - tolerance)
+            else:
+                # Folga absoluta para métricas que ficam perto de zero
+                bad = new > old * (1 + tolerance) + (1.0 if metric != "setup_ms" else 5.0)
+            if bad:
+                regressions.append(f"{name}.{metric}: {old} -> {new}")
+    old = baseline.get("startup_ms")
+    if old is not None and results["startup_ms"] > old * (1 + tolerance) + 20:
+        regressions.append(f"startup_ms: {old} -> {results['startup_ms']}")
+    return regressions
+
+
+def print_report(results: dict, baseline: dict) -> None:
+    print(f"Inicialização: {results['startup_ms']} ms"
+          + (f" (baseline {baseline['startup_ms']} ms)" if baseline.get("startup_ms") else ""))
+    startup = results["startup"]
+    if startup:
+        print(f"  primeiro quadro {startup.get('first_frame_ms')} ms, jogo pronto {startup.get('interactive_ms')} ms")
+    print(f"{'cenário':<9} {'update/s':>9} {'draw/s':>8} {'pico KB':>8} {'retido B':>9} {'setup ms':>9} {'sprites':>8}")
+    for name, m in results["scenarios"].items():
+        print(f"{name:<9} {m['update_per_s']:>9} {m['draw_per_s']:>8} {m['alloc_peak_kb']:>8} "
+              f"{m['retained_b_per_frame']:>9} {m['setup_ms']:>9} {m['sprites']:>8}")
+        base = baseline.get("scenarios", {}).get(name)
+        if base:
+            print(f"{'  base':<9} {base['update_per_s']:>9} {base['draw_per_s']:>8} {base['alloc_peak_kb']:>8} "
+                  f"{base['retained_b_per_frame']:>9} {base['setup_ms']:>9}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmarks da simulação e da renderização")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="só estes cenários")
+    parser.add_argument("--frames", type=int, default=1200, help="quadros por cenário")
+    parser.add_argument("--repeat", type=int, default=3, help="execuções por medida (vale a melhor)")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="piora relativa aceita (0.25 = 25%%)")
+    parser.add_argument("--baseline", default=BASELINE, help="arquivo da baseline")
+    parser.add_argument("--save-baseline", action="store_true", help="grava os resultados como nova baseline")
+    parser.add_argument("--no-atlas", action="store_true", help="desenha com as imagens soltas (sem atlas)")
+    parser.add_argument("--no-baked", action="store_true", help="inicialização sem o cache de imagens (bake.py)")
+    parser.add_argument("--startup-probe", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.startup_probe:
+        startup_probe(baked=not args.no_baked)
+        return
+
+    game = make_game()
+    if args.no_atlas:
+        game.atlas = None
+    startup = measure_startup(baked=not args.no_baked)
+    results = {"machine": machine(), "frames": args.frames, "startup_ms": startup.pop("startup_ms"),
+               "startup": startup, "scenarios": {}}
+    for name in args.scenario or SCENARIOS:
+        random.seed(SEED)  # Sprites criados fora do rng da partida
+        results["scenarios"][name] = run_scenario(game, name, args.frames, args.repeat)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print_report(results, baseline)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline salva em {args.baseline}")
+        return
+    if not baseline:
+        print(f"Sem baseline ({args.baseline}); rode com --save-baseline")
+        return
+    if baseline.get("machine") != results["machine"]:
+        print("Aviso: baseline gravada em outra máquina/versão; compare com cuidado")
+    if baseline.get("frames") != results["frames"]:
+        print(f"Aviso: baseline com {baseline.get('frames')} quadros, esta medida com {results['frames']}; "
+              "métricas por quadro não comparadas")
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print("REGRESSÃO DE DESEMPENHO:")
+        for line in regressions:
+            print("  " + line)
+        sys.exit(1)
+    print("Sem regressões")
+
+
+if __name__ == "__main__":
+    main()
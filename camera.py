@@ -0,0 +1,66 @@
+import pygame
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+class Camera:
+    """Converte coordenadas do mundo (float) para coordenadas da tela.
+
+    O mundo usa o mesmo eixo da tela (y cresce para baixo), então subir no jogo
+    significa y cada vez mais negativo. Rolar a tela é só mudar self.y: nenhum
+    sprite precisa ser movido.
+    """
+
+    def __init__(self, width: int = SCREEN_WIDTH, height: int = SCREEN_HEIGHT) -> None:
+        self.y = 0.0  # Topo da área visível em coordenadas do mundo
+        self.prev_y = 0.0  # Valor de y no passo de simulação anterior
+        self.width = width
+        self.height = height
+
+    @property
+    def top(self) -> float:
+        return self.y
+
+    @property
+    def bottom(self) -> float:
+        return self.y + self.height
+
+    def begin_step(self) -> None:
+        """Chamado no início de cada passo de simulação"""
+        self.prev_y = self.y
+
+    @property
+    def moving(self) -> bool:
+        """A câmera mudou no último passo (a tela interpolada está rolando)"""
+        return self.y != self.prev_y
+
+    def scroll(self, dy: float) -> None:
+        """Move a câmera dy pixels para cima"""
+        self.y -= dy
+
+    def to_screen_y(self, y: float) -> float:
+        return y - self.y
+
+    def to_world_y(self, screen_y: float) -> float:
+        return screen_y + self.y
+
+    def apply(self, sprite: pygame.sprite.Sprite, alpha: float = 1.0) -> pygame.Rect:
+        """Retângulo do sprite na tela, calculado a partir da posição float.
+
+        alpha (0..1) interpola entre o passo anterior e o atual, para desenhar
+        suavemente quando a renderização roda mais rápido que a simulação.
+        """
+        rect = sprite.rect
+        if alpha >= 1.0:
+            return pygame.Rect(round(sprite.x), round(sprite.y - self.y), rect.width, rect.height)
+        x = sprite.prev_x + (sprite.x - sprite.prev_x) * alpha
+        y = sprite.prev_y + (sprite.y - sprite.prev_y) * alpha
+        cam_y = self.prev_y + (self.y - self.prev_y) * alpha
+        return pygame.Rect(round(x), round(y - cam_y), rect.width, rect.height)
+
+    def is_visible(self, rect: pygame.Rect) -> bool:
+        """Retângulo em coordenadas do mundo intersecta a área visível?"""
+        return rect.bottom > self.y and rect.top < self.y + self.height
+
+    def is_below_view(self, rect: pygame.Rect) -> bool:
+        """Retângulo já saiu por baixo da tela (pode ser removido)"""
+        return rect.top >= self.y + self.height
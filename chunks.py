@@ -0,0 +1,175 @@
+import random
+import threading
+from collections import deque
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+import settings
+
+PLATFORM_WIDTH = 70
+
+# Plataforma inicial, logo abaixo do jogador (topo do chunk 0)
+START_X = SCREEN_WIDTH // 2 - 35
+START_Y = 500
+
+
+class Chunk:
+    """Conteúdo de uma faixa de altura fixa do mundo.
+
+    platforms: lista de (tipo, x, y, vx) na ordem de subida.
+    powerups: lista de (tipo, x, y) com x/y da base do power-up.
+    """
+    __slots__ = ("index", "top", "bottom", "platforms", "powerups")
+
+    def __init__(self, index: int, top: int, bottom: int) -> None:
+        self.index = index
+        self.top = top
+        self.bottom = bottom
+        self.platforms = []
+        self.powerups = []
+
+
+def chunk_bottom(index: int) -> int:
+    """y (mundo) da base do chunk; o chunk 0 é a primeira tela"""
+    return SCREEN_HEIGHT - index * settings.CHUNK_HEIGHT
+
+
+def _entry(seed: int, index: int) -> tuple:
+    """Primeira plataforma do chunk, função pura de (semente, índice)"""
+    if index == 0:
+        return START_X, START_Y
+    rng = random.Random(f"{seed}:{index}:entrada")
+    x = rng.randrange(0, SCREEN_WIDTH - PLATFORM_WIDTH)
+    y = chunk_bottom(index) - rng.randrange(0, settings.PLATFORM_GAP_MIN)
+    return x, y
+
+
+def _gap_count(rng: random.Random, distance: int) -> int:
+    """Quantos intervalos (entre GAP_MIN e GAP_MAX) somam exatamente distance"""
+    gap_min, gap_max = settings.PLATFORM_GAP_MIN, settings.PLATFORM_GAP_MAX
+    fewest = -(-distance // gap_max)
+    most = distance // gap_min
+    if fewest <= most:
+        return rng.randint(fewest, most)
+    # Sem combinação exata (constantes fora do comum): aproxima pela média
+    return max(1, round(distance / ((gap_min + gap_max) / 2)))
+
+
+def generate_chunk(seed: int, index: int) -> Chunk:
+    """Gera o chunk index. Mesma (semente, índice) -> mesmo conteúdo, sempre.
+
+    A primeira plataforma de cada chunk é fixada por _entry(), e a última é
+    escolhida para que a entrada do chunk seguinte fique a um pulo normal
+    de distância (intervalo vertical e deslocamento horizontal dentro dos
+    limites de settings), então chunks gerados separadamente se encaixam.
+    """
+    bottom = chunk_bottom(index)
+    chunk = Chunk(index, bottom - settings.CHUNK_HEIGHT, bottom)
+    rng = random.Random(f"{seed}:{index}")
+    x, y = _entry(seed, index)
+    next_x, next_y = _entry(seed, index + 1)
+    gap_min, gap_max = settings.PLATFORM_GAP_MIN, settings.PLATFORM_GAP_MAX
+    drift = settings.PLATFORM_DRIFT
+
+    distance = y - next_y
+    gaps = _gap_count(rng, distance)
+    for i in range(gaps):
+        # Tipo da plataforma (as primeiras do jogo são sempre normais)
+        kind, vx = "normal", 0
+        if index > 0 or i >= settings.SAFE_PLATFORMS:
+            roll = rng.random()
+            if roll < settings.MOVING_CHANCE and y < settings.MOVING_MAX_SCREEN_Y:
+                kind, vx = "moving", rng.choice([-2, 2])
+            elif roll < settings.BREAKING_CHANCE and y < settings.BREAKING_MAX_SCREEN_Y:
+                kind = "breaking"
+        chunk.platforms.append((kind, x, y, vx))
+
+        # Chance de power-up sobre a plataforma
+        if (index > 0 or i >= settings.SAFE_PLATFORMS) and rng.random() < settings.POWERUP_CHANCE \
+                and y < settings.POWERUP_MAX_SCREEN_Y:
+            pu_type = "spring" if rng.random() < settings.SPRING_CHANCE else "jetpack"
+            chunk.powerups.append((pu_type, x + PLATFORM_WIDTH // 2, y))
+
+        # Próxima plataforma: o intervalo restante continua alcançável
+        remaining = gaps - i - 1
+        if remaining == 0:
+            break
+        lo = max(gap_min, distance - gap_max * remaining)
+        hi = min(gap_max, distance - gap_min * remaining)
+        gap = rng.randint(lo, hi) if lo <= hi else distance // (remaining + 1)
+        distance -= gap
+        y -= gap
+        # x anda no máximo drift por plataforma e termina perto da próxima entrada
+        lo_x = max(x - drift, next_x - drift * remaining, 0)
+        hi_x = min(x + drift, next_x + drift * remaining, SCREEN_WIDTH - PLATFORM_WIDTH)
+        x = rng.randint(lo_x, hi_x) if lo_x <= hi_x else max(0, min(x, SCREEN_WIDTH - PLATFORM_WIDTH))
+    return chunk
+
+
+class ChunkStreamer:
+    """Produz os próximos chunks antes da câmera chegar neles.
+
+    Mantém um buffer circular com até `lookahead` chunks prontos. Com
+    threaded=True a geração roda numa thread separada; senão ela é feita em
+    refill(), fora do quadro crítico. Como os chunks são funções puras da
+    semente, usar ou não a thread não muda o jogo.
+    """
+
+    def __init__(self, seed: int, lookahead: int = 3, threaded: bool = False, first: int = 0) -> None:
+        self.seed = seed
+        self.lookahead = lookahead
+        self.buffer = deque(maxlen=lookahead)
+        self.next_index = first  # Próximo chunk a ser entregue
+        self.produced = first  # Próximo chunk a ser gerado
+        # Estatísticas: chunks que precisaram ser gerados na hora
+        self.misses = 0
+        self.lock = threading.Condition()
+        self.thread = None
+        self.stopped = False
+        if threaded:
+            self.thread = threading.Thread(target=self._worker, name="chunk-producer", daemon=True)
+            self.thread.start()
+
+    def _worker(self) -> None:
+        while True:
+            with self.lock:
+                while not self.stopped and len(self.buffer) >= self.lookahead:
+                    self.lock.wait()
+                if self.stopped:
+                    return
+                index = self.produced
+            chunk = generate_chunk(self.seed, index)
+            with self.lock:
+                # O buffer pode ter sido consumido/pulado enquanto gerávamos
+                if index == self.produced and not self.stopped:
+                    self.buffer.append(chunk)
+                    self.produced += 1
+                    self.lock.notify_all()
+
+    def refill(self) -> None:
+        """Completa o buffer (modo sem thread)"""
+        if self.thread is not None:
+            return
+        while len(self.buffer) < self.lookahead:
+            self.buffer.append(generate_chunk(self.seed, self.produced))
+            self.produced += 1
+
+    def take(self) -> Chunk:
+        """Entrega o próximo chunk (gera na hora se o buffer estiver vazio)"""
+        with self.lock:
+            if self.buffer:
+                chunk = self.buffer.popleft()
+                self.lock.notify_all()
+            else:
+                chunk = None
+        if chunk is None:
+            self.misses += 1
+            chunk = generate_chunk(self.seed, self.next_index)
+            with self.lock:
+                if self.produced <= self.next_index:
+                    self.produced = self.next_index + 1
+        self.next_index += 1
+        return chunk
+
+    def stop(self) -> None:
+        with self.lock:
+            self.stopped = True
+            self.lock.notify_all()
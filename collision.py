@@ -0,0 +1,79 @@
+import pygame
+
+# Colisão contínua (swept AABB): as posições guardam o passo anterior
+# (prev_x/prev_y), então o movimento de cada passo é um segmento. As funções
+# daqui dizem em que fração t (0 a 1) do passo o contato começou e o
+# Game.update resolve os contatos do mais cedo para o mais tarde; uma queda
+# rápida não atravessa plataformas nem inimigos.
+
+LANDING_TOLERANCE = 10  # Pousa se os pés estão até 10 px abaixo do topo da plataforma
+STOMP_TOLERANCE = 15  # Pisa no inimigo se os pés estão até 15 px abaixo do topo do hitbox
+
+
+def swept_rect(sprite) -> pygame.Rect:
+    """Retângulo que cobre o sprite no passo anterior e no atual (para consultar o índice)"""
+    rect = sprite.rect
+    previous = rect.move(round(sprite.prev_x) - rect.x, round(sprite.prev_y) - rect.y)
+    return rect.union(previous)
+
+
+def landing_time(player, platform) -> float:
+    """Fração do passo em que os pés do jogador chegaram ao topo da plataforma, ou None.
+
+    Vale a regra de sempre (sobrepõe no fim do passo e os pés estão até
+    LANDING_TOLERANCE abaixo do topo) e, além dela, o cruzamento do topo no
+    meio do passo, desde que nesse instante os dois se sobreponham na
+    horizontal (a plataforma pode estar andando).
+    """
+    rect = player.rect
+    top = platform.rect.top
+    # Posições inteiras (as mesmas dos rects) no início e no fim do passo
+    before = round(player.prev_y) + rect.height
+    after = rect.bottom
+    if rect.colliderect(platform.rect) and after <= top + LANDING_TOLERANCE:
+        return min(1.0, max(0.0, (top - before) / (after - before))) if after > before else 0.0
+    if not before <= top < after:
+        return None  # Não cruzou o topo (só encostar ainda não é pouso)
+    t = (top - before) / (after - before)
+    x = round(player.prev_x) + (rect.x - round(player.prev_x)) * t
+    platform_x = round(platform.prev_x) + (platform.rect.x - round(platform.prev_x)) * t
+    if x < platform_x + platform.rect.width and platform_x < x + rect.width:
+        return t
+    return None
+
+
+def hit_time(player, enemy) -> tuple:
+    """Primeiro contato do jogador com o hitbox do inimigo durante o passo.
+
+    Retorna (t, por_cima) ou None; por_cima diz se os pés estavam até
+    STOMP_TOLERANCE abaixo do topo do hitbox no instante do contato (pisão).
+    O teste é feito no movimento relativo dos dois (método das faixas).
+    """
+    rect = player.rect
+    hitbox = enemy.hitbox
+    # Caixas inteiras (as dos rects) no início do passo e deslocamentos até o
+    # fim; o hitbox acompanha o rect do inimigo
+    px, py = round(player.prev_x), round(player.prev_y)
+    pdx, pdy = rect.x - px, rect.y - py
+    edx, edy = enemy.rect.x - round(enemy.prev_x), enemy.rect.y - round(enemy.prev_y)
+    ex, ey = hitbox.x - edx, hitbox.y - edy
+    dx, dy = pdx - edx, pdy - edy
+
+    entry, leave = 0.0, 1.0
+    for start, size, other, other_size, d in ((px, rect.width, ex, hitbox.width, dx),
+                                              (py, rect.height, ey, hitbox.height, dy)):
+        if d == 0:
+            if start >= other + other_size or other >= start + size:
+                return None
+            continue
+        t1 = (other - (start + size)) / d
+        t2 = (other + other_size - start) / d
+        if t1 > t2:
+            t1, t2 = t2, t1
+        entry = max(entry, t1)
+        leave = min(leave, t2)
+        if entry >= leave:
+            return None
+    bottom = py + rect.height + pdy * entry
+    top = ey + edy * entry
+    return entry, bottom <= top + STOMP_TOLERANCE
@@ -0,0 +1,324 @@
+"""Ambiente vetorizado (no estilo Gym) para treinar e avaliar bots.
+
+VectorEnv roda N partidas headless independentes no mesmo processo (ou
+divididas entre processos com workers > 1) e avança todas com um único
+step(actions). Cada ação é um índice de ACTIONS (nada, esquerda, direita),
+aplicado como os bits de controle de Game.step.
+
+Observação de cada partida (float32, ver observation_size):
+
+  - jogador: x e y na tela (0 a 1), vx, vy, power-up ativo;
+  - as K plataformas mais próximas: presente, dx, dy, vx, móvel, quebrável;
+  - os K inimigos mais próximos: presente, dx, dy, vx, vy.
+
+dx/dy são relativos ao centro do jogador em frações da tela; posições
+vazias ficam zeradas. A recompensa é quanto Level.total_height_climbed
+subiu no passo (em centenas de pixels). Partidas que terminam (morte ou
+max_steps) recomeçam sozinhas com nova semente, reaproveitando assets e
+pools; a observação final e o resultado vão em info.
+
+Rodado direto, mede a vazão (passos de partida por segundo) para vários N
+com ações aleatórias.
+
+Exemplos:
+
+    python env.py
+    python env.py --envs 1 4 16 --steps 20000 --workers 2
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import time
+from itertools import chain
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+try:
+    import numpy as np
+except ImportError:  # Sem NumPy o jogo funciona, só o ambiente não
+    np = None
+
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, INPUT_LEFT, INPUT_RIGHT
+
+ACTIONS = (0, INPUT_LEFT, INPUT_RIGHT)
+PLAYER_FEATURES = 5
+PLATFORM_FEATURES = 6
+ENEMY_FEATURES = 5
+VELOCITY_SCALE = 10.0  # vx/vy divididos por este valor
+REWARD_SCALE = 0.01  # Recompensa por pixel escalado
+
+
+def observation_size(platforms: int, enemies: int) -> int:
+    return PLAYER_FEATURES + platforms * PLATFORM_FEATURES + enemies * ENEMY_FEATURES
+
+
+# Tipo de plataforma -> (móvel, quebrável)
+PLATFORM_KINDS = {"normal": (0.0, 0.0), "moving": (1.0, 0.0), "breaking": (0.0, 1.0)}
+
+
+def _nearest(sprites: list, counts: list, px, py, k: int) -> tuple:
+    """Os k sprites mais próximos do jogador em cada partida.
+
+    sprites tem os sprites de todas as partidas em sequência e counts quantos
+    são de cada uma. Retorna arrays (partida, posição 0..k-1, índice em
+    sprites, dx, dy) só dos escolhidos, do mais próximo para o mais distante;
+    no empate vale a ordem original, como em heapq.nsmallest.
+    """
+    centers = np.fromiter(chain.from_iterable(s.rect.center for s in sprites), dtype=np.float64,
+                          count=len(sprites) * 2).reshape(-1, 2)
+    counts = np.array(counts)
+    owner = np.repeat(np.arange(len(counts)), counts)
+    dx = centers[:, 0] - px[owner]
+    dy = centers[:, 1] - py[owner]
+    order = np.lexsort((dx * dx + dy * dy, owner))  # Por partida, depois por distância
+    rank = np.arange(len(order)) - (np.cumsum(counts) - counts)[owner[order]]
+    order = order[rank < k]
+    return owner[order], rank[rank < k], order, dx[order], dy[order]
+
+
+def observe_batch(games: list, platforms: int, enemies: int) -> "np.ndarray":
+    """Observações de várias partidas de uma vez (uma linha por partida).
+
+    A busca dos mais próximos é feita em lote com NumPy só sobre os centros;
+    os outros atributos (velocidade, tipo) só são lidos dos sprites escolhidos.
+    """
+    players = []
+    platform_sprites, platform_counts = [], []
+    enemy_sprites, enemy_counts = [], []
+    for game in games:
+        player = game.player
+        level = game.level
+        if level.movers is not None:
+            level.movers.flush()  # vx/vy atualizados ficam nos arrays
+        rect = player.rect
+        players.append((rect.centerx, rect.centery, level.camera.y, player.vx, player.vy, player.powered_up))
+        sprites = level.platforms.sprites()
+        platform_sprites += sprites
+        platform_counts.append(len(sprites))
+        sprites = level.enemies.sprites()
+        enemy_sprites += sprites
+        enemy_counts.append(len(sprites))
+
+    n = len(games)
+    players = np.array(players, dtype=np.float64)
+    px, py = players[:, 0], players[:, 1]
+    obs = np.zeros((n, observation_size(platforms, enemies)), dtype=np.float32)
+    obs[:, 0] = px / SCREEN_WIDTH
+    obs[:, 1] = (py - players[:, 2]) / SCREEN_HEIGHT  # y na tela
+    obs[:, 2:4] = players[:, 3:5] / VELOCITY_SCALE
+    obs[:, 4] = players[:, 5]
+
+    column = PLAYER_FEATURES
+    if platforms:
+        game, rank, index, dx, dy = _nearest(platform_sprites, platform_counts, px, py, platforms)
+        block = np.zeros((n, platforms, PLATFORM_FEATURES), dtype=np.float32)
+        chosen = [platform_sprites[i] for i in index.tolist()]
+        block[game, rank, 0] = 1.0
+        block[game, rank, 1] = dx / SCREEN_WIDTH
+        block[game, rank, 2] = dy / SCREEN_HEIGHT
+        if chosen:
+            block[game, rank, 3:] = [(getattr(p, "vx", 0) / VELOCITY_SCALE, *PLATFORM_KINDS[p.type]) for p in chosen]
+        obs[:, column:column + platforms * PLATFORM_FEATURES] = block.reshape(n, -1)
+        column += platforms * PLATFORM_FEATURES
+    if enemies:
+        game, rank, index, dx, dy = _nearest(enemy_sprites, enemy_counts, px, py, enemies)
+        block = np.zeros((n, enemies, ENEMY_FEATURES), dtype=np.float32)
+        chosen = [enemy_sprites[i] for i in index.tolist()]
+        block[game, rank, 0] = 1.0
+        block[game, rank, 1] = dx / SCREEN_WIDTH
+        block[game, rank, 2] = dy / SCREEN_HEIGHT
+        if chosen:
+            block[game, rank, 3:] = [(e.vx / VELOCITY_SCALE, e.vy / VELOCITY_SCALE) for e in chosen]
+        obs[:, column:column + enemies * ENEMY_FEATURES] = block.reshape(n, -1)
+    return obs
+
+
+class GameBatch:
+    """Várias partidas headless avançadas juntas (a parte que roda em cada processo).
+
+    Cada partida tem seu próprio gerador de sementes, derivado da semente de
+    reset() e do índice global (first + i), então o resultado não depende de
+    como as partidas foram divididas entre processos.
+    """
+
+    def __init__(self, count: int, platforms: int = 5, enemies: int = 3, max_steps: int = 20000,
+                 first: int = 0) -> None:
+        from game import Game
+        self.games = [Game(headless=True) for _ in range(count)]  # Assets carregados uma vez só
+        self.platforms = platforms
+        self.enemies = enemies
+        self.max_steps = max_steps
+        self.first = first
+        self.rngs = [random.Random() for _ in range(count)]
+        self.obs = None
+        self.heights = [0.0] * count
+        self.returns = [0.0] * count
+
+    def _start(self, i: int) -> None:
+        game = self.games[i]
+        game.reset(self.rngs[i].getrandbits(63))
+        self.heights[i] = game.level.total_height_climbed
+        self.returns[i] = 0.0
+
+    def reset(self, seed: int = None) -> "np.ndarray":
+        for i, rng in enumerate(self.rngs):
+            rng.seed(None if seed is None else f"{seed}:{self.first + i}")
+            self._start(i)
+        self.obs = observe_batch(self.games, self.platforms, self.enemies)
+        return self.obs.copy()
+
+    def step(self, actions) -> tuple:
+        count = len(self.games)
+        rewards = np.zeros(count, dtype=np.float32)
+        terminated = np.zeros(count, dtype=bool)
+        truncated = np.zeros(count, dtype=bool)
+        done = []
+        for i, (game, action) in enumerate(zip(self.games, actions)):
+            alive = game.step(ACTIONS[action])
+            height = game.level.total_height_climbed
+            reward = (height - self.heights[i]) * REWARD_SCALE
+            self.heights[i] = height
+            self.returns[i] += reward
+            rewards[i] = reward
+            if not alive or game.frame >= self.max_steps:
+                terminated[i] = not alive
+                truncated[i] = alive
+                done.append(i)
+        self.obs = observe_batch(self.games, self.platforms, self.enemies)
+
+        # Recomeço automático: a observação final vai em info
+        final = {}
+        episodes = []
+        for i in done:
+            game = self.games[i]
+            final[i] = self.obs[i].copy()
+            episodes.append({"env": self.first + i, "seed": game.seed, "score": game.score, "frames": game.frame,
+                             "cause": game.death_cause or "timeout", "return": self.returns[i]})
+            self._start(i)
+        if done:
+            self.obs[done] = observe_batch([self.games[i] for i in done], self.platforms, self.enemies)
+        return self.obs.copy(), rewards, terminated, truncated, {"final_observation": final, "episodes": episodes}
+
+
+def _worker(conn, count: int, first: int, options: dict) -> None:
+    """Processo com um GameBatch, comandado por mensagens no pipe"""
+    batch = GameBatch(count, first=first, **options)
+    while True:
+        command, arg = conn.recv()
+        if command == "step":
+            conn.send(batch.step(arg))
+        elif command == "reset":
+            conn.send(batch.reset(arg))
+        else:
+            break
+    conn.close()
+
+
+class VectorEnv:
+    """N partidas com step(actions) em lote; com workers > 1 divididas entre processos"""
+
+    def __init__(self, num_envs: int, platforms: int = 5, enemies: int = 3, max_steps: int = 20000,
+                 workers: int = 1) -> None:
+        if np is None:
+            raise RuntimeError("VectorEnv precisa do NumPy: instale o pacote numpy")
+        self.num_envs = num_envs
+        self.action_count = len(ACTIONS)
+        self.observation_size = observation_size(platforms, enemies)
+        options = {"platforms": platforms, "enemies": enemies, "max_steps": max_steps}
+        workers = max(1, min(workers, num_envs))
+        # Partidas por processo, o mais igual possível
+        self.sizes = [num_envs // workers + (i < num_envs % workers) for i in range(workers)]
+        self.batch = None
+        self.pipes = []
+        self.processes = []
+        if workers == 1:
+            self.batch = GameBatch(num_envs, **options)
+            return
+        first = 0
+        for size in self.sizes:
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_worker, args=(child, size, first, options), daemon=True)
+            process.start()
+            child.close()
+            self.pipes.append(parent)
+            self.processes.append(process)
+            first += size
+
+    def reset(self, seed: int = None) -> "np.ndarray":
+        """Começa todas as partidas; a mesma semente gera as mesmas partidas"""
+        if self.batch is not None:
+            return self.batch.reset(seed)
+        for pipe in self.pipes:
+            pipe.send(("reset", seed))
+        return np.concatenate([pipe.recv() for pipe in self.pipes])
+
+    def step(self, actions) -> tuple:
+        """Avança todas as partidas um passo.
+
+        Retorna (observações, recompensas, terminadas, truncadas, info); info
+        traz "final_observation" (índice -> observação antes do recomeço) e
+        "episodes" (resultado de cada partida que terminou).
+        """
+        if self.batch is not None:
+            return self.batch.step(actions)
+        start = 0
+        for pipe, size in zip(self.pipes, self.sizes):
+            pipe.send(("step", actions[start:start + size]))
+            start += size
+        obs, rewards, terminated, truncated = [], [], [], []
+        info = {"final_observation": {}, "episodes": []}
+        start = 0
+        for pipe, size in zip(self.pipes, self.sizes):
+            o, r, te, tr, i = pipe.recv()
+            obs.append(o)
+            rewards.append(r)
+            terminated.append(te)
+            truncated.append(tr)
+            info["final_observation"].update((start + k, v) for k, v in i["final_observation"].items())
+            info["episodes"] += i["episodes"]
+            start += size
+        return (np.concatenate(obs), np.concatenate(rewards), np.concatenate(terminated),
+                np.concatenate(truncated), info)
+
+    def close(self) -> None:
+        for pipe in self.pipes:
+            pipe.send(("close", None))
+        for process in self.processes:
+            process.join()
+        self.pipes = []
+        self.processes = []
+
+
+def measure(num_envs: int, steps: int, workers: int) -> dict:
+    """Passos de partida por segundo com ações aleatórias"""
+    env = VectorEnv(num_envs, workers=workers)
+    env.reset(0)
+    rng = np.random.default_rng(0)
+    batches = max(1, steps // num_envs)
+    actions = rng.integers(0, env.action_count, size=(batches, num_envs))
+    episodes = 0
+    start = time.perf_counter()
+    for row in actions:
+        episodes += len(env.step(row)[4]["episodes"])
+    elapsed = time.perf_counter() - start
+    env.close()
+    return {"envs": num_envs, "steps_per_s": round(batches * num_envs / elapsed),
+            "batches_per_s": round(batches / elapsed), "episodes": episodes}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Vazão do ambiente vetorizado")
+    parser.add_argument("--envs", type=int, nargs="+", default=[1, 2, 4, 8, 16], help="números de partidas a medir")
+    parser.add_argument("--steps", type=int, default=20000, help="passos de partida por medida")
+    parser.add_argument("--workers", type=int, default=1, help="processos (1 = tudo neste processo)")
+    args = parser.parse_args()
+
+    print(f"{'partidas':>8} {'passos/s':>9} {'lotes/s':>8} {'partidas fim':>12}")
+    for num_envs in args.envs:
+        m = measure(num_envs, args.steps, args.workers)
+        print(f"{m['envs']:>8} {m['steps_per_s']:>9} {m['batches_per_s']:>8} {m['episodes']:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,97 @@
 import pygame
 import os
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, WHITE, BLACK, IMG_DIR, SND_DIR, FONT_DIR, GREEN
+import random
+import time
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, WHITE, BLACK, SND_DIR, FONT_DIR, GREEN, RENDER_MODE
+from settings import RENDER_FPS, MAX_STEPS_PER_FRAME, IDLE_WAIT_MS, REWIND_BUFFER_SECONDS, REWIND_SECONDS
+from settings import SCORES_DB, LEADERBOARD_SIZE, SCALED_DISPLAY, ADAPTIVE_QUALITY, SPRITE_ATLAS
+from assets import assets
 from sprites import Player
-from level import Level
+from level import Level, make_pools
+from text import TextRenderer, ScoreHUD
+from render import DirtyRenderer, AdaptiveQuality
+from inputs import KeyboardInput, RecordingInput, ReplayInput
+from replay import Replay
+from spatial import BucketGroup
+from profiler import FrameProfiler, ProfilerOverlay
+from snapshot import SnapshotRing, capture, restore
+from sounds import SoundBank
+from scores import ScoreStore
+from collision import swept_rect, landing_time, hit_time, STOMP_TOLERANCE
+from atlas import TextureAtlas, ATLAS_KEYS
+from spectate import ghost_image
 
 class Game:
-    def __init__(self) -> None:
-        pygame.init()
-        pygame.mixer.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Doodle Jump")
+    def __init__(self, headless: bool = False) -> None:
+        # Modo headless: sem janela, sem mixer e sem renderização; a simulação
+        # é avançada com step() o mais rápido que a CPU permitir
+        self.headless = headless
         self.clock = pygame.time.Clock()
         self.running = True
+        self.frame = 0
+        
+        # Pools de sprites reaproveitados entre partidas
+        self.pools = make_pools()
+        self.level = None
+        self.player = None
+        
+        # Fonte dos controles (teclado, roteiro ou replay) e gravação da última partida
+        self.input = KeyboardInput()
+        self.seed = None
+        self.rng = None
+        self.last_replay = None
+        
+        # Snapshots: o início da partida (tentar de novo) e os últimos quadros (voltar no tempo)
+        self.start_snapshot = None
+        self.rewind = SnapshotRing(REWIND_BUFFER_SECONDS * FPS)
+        self.rewind_requested = False
+        self.retry_requested = False
+        
+        # Profiler por fases (opcional: --profile ou F3 durante o jogo)
+        self.profiler = None
+        self.show_profiler = False
+        self.profiler_overlay = None
+        
+        # Tempos de inicialização em ms (primeiro quadro e jogo pronto)
+        self.startup = {}
+        
+        # Qualidade adaptativa do desenho (só usada no loop com janela)
+        self.quality = AdaptiveQuality(1000 / (RENDER_FPS or FPS), enabled=ADAPTIVE_QUALITY)
+        
+        # Placar persistente (só com janela: partidas headless não contam)
+        self.scores = None
+        self.last_rank = None
+        self.atlas = None
+        self.spectators = None  # SpectatorServer que recebe cada passo (main.py --serve)
+        self.ghost = None  # GhostClient cujo jogador é desenhado por cima (main.py --ghost)
+        
+        if headless:
+            self.screen = None
+            assets.load_all()
+            self.sounds = SoundBank(enabled=False)
+            return
+        
+        # Primeiro a janela e a tela de carregamento; mixer, imagens e sons depois
+        start = time.perf_counter()
+        pygame.display.init()
+        pygame.font.init()
+        # A tela é sempre a superfície lógica; com SCALED o SDL escala na apresentação.
+        # Sem janela de verdade (driver "dummy": bench, testes) não há o que
+        # escalar e o SCALED só passaria cada quadro pelo renderizador por software
+        scaled = SCALED_DISPLAY and pygame.display.get_driver() != "dummy"
+        flags = pygame.SCALED | pygame.RESIZABLE if scaled else 0
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), flags)
+        pygame.display.set_caption("Doodle Jump")
+        self.loading_font = pygame.font.Font(None, 28)
+        self.draw_loading(0.0)
+        self.startup["first_frame_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        
+        # Imagens e sons são decodificados numa thread enquanto o resto é preparado
+        pygame.mixer.init()
+        assets.start_loading()
+        
+        # O placar abre o banco e lê os recordes na sua própria thread
+        self.scores = ScoreStore(SCORES_DB, LEADERBOARD_SIZE)
         
         # Carregar fonte personalizada se existir, senão usar Arial
         self.font_path = os.path.join(FONT_DIR, "game_font.ttf")
@@ -19,89 +99,314 @@ class Game:
             self.font_name = self.font_path
         else:
             self.font_name = pygame.font.match_font("arial")
-            
-        # Carregar sons
-        self.game_over_sound = pygame.mixer.Sound(os.path.join(SND_DIR, "game_over.wav"))
-        self.game_over_sound.set_volume(0.6)
+        
+        # Cache de fontes/textos e placar desenhado a partir de uma faixa de dígitos
+        self.text = TextRenderer()
+        self.score_hud = ScoreHUD(self.text, "arial", self.get_font_size(16), WHITE)
+        
+        # Espera o resto dos assets mostrando o progresso
+        self.wait_for_assets()
+        
+        # Toda a arte dos sprites numa superfície só (precisa dos assets convertidos);
+        # o fantasma vai junto porque o DirtyRenderer desenha tudo a partir do atlas
+        self.ghost_image = ghost_image(assets.image("player"))
+        if SPRITE_ATLAS:
+            images = {key: assets.image(key) for key in ATLAS_KEYS}
+            images["ghost"] = self.ghost_image
+            self.atlas = TextureAtlas(images)
+        
+        # Central de sons: canais por grupo, limite de vozes e prioridades
+        self.sounds = SoundBank()
         
         # Carregar música de fundo
         pygame.mixer.music.load(os.path.join(SND_DIR, "background_music.ogg"))
         pygame.mixer.music.set_volume(0.3)
         
-        # Carregar imagens para menu
-        try:
-            self.menu_background = pygame.image.load(os.path.join(IMG_DIR, "background2.png")).convert()
-            self.menu_background = pygame.transform.scale(self.menu_background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        except:
-            self.menu_background = None
+        # Camada fixa da tela de game over (composta no primeiro uso)
+        self.game_over_static = None
+        
+        # Imagem do menu (None se background2.png não existir)
+        self.menu_background = assets.image("menu_background")
+        if self.menu_background is None:
             print("Aviso: background2.png não encontrado. Usando cor sólida.")
+        self.startup["interactive_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    
+    def draw_loading(self, progress: float) -> None:
+        """Tela de carregamento com barra de progresso (fonte padrão, sem assets)"""
+        self.screen.fill(BLACK)
+        text = self.loading_font.render("Carregando...", True, WHITE)
+        self.screen.blit(text, text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 30)))
+        bar = pygame.Rect(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2, 200, 16)
+        pygame.draw.rect(self.screen, WHITE, bar, 2)
+        pygame.draw.rect(self.screen, GREEN, (bar.x + 3, bar.y + 3, int((bar.width - 6) * progress), bar.height - 6))
+        pygame.display.flip()
+    
+    def wait_for_assets(self) -> None:
+        """Converte os assets que a thread for entregando até terminar"""
+        while True:
+            progress = assets.poll()
+            self.draw_loading(progress)
+            if progress >= 1.0:
+                return
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.running = False
+            # Acorda a cada quadro para a barra, ou antes se a thread terminar
+            assets.wait(1 / FPS)
     
     def new(self) -> None:
+        if self.retry_requested and self.start_snapshot is not None:
+            # Mesma partida do começo, sem recriar nada
+            self.retry()
+        else:
+            self.reset()
+        # Iniciar música
+        pygame.mixer.music.play(loops=-1)
+        self.run()
+    
+    def reset(self, seed: int = None) -> None:
+        """Prepara uma nova partida sem entrar no loop principal.
+
+        Com a mesma semente (e os mesmos controles) a partida é idêntica.
+        """
+        if seed is None:
+            seed = random.getrandbits(63)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        
+        # Devolve os sprites da partida anterior aos pools
+        if self.level is not None:
+            self.level.clear(self.player)
+        
         # Inicializa novos grupos de sprites e cria o player e level
         self.all_sprites = pygame.sprite.Group()
-        self.platforms = pygame.sprite.Group()
-        self.player = Player()
+        self.platforms = BucketGroup()  # Índice vertical para as colisões de pouso
+        self.player = Player(self.sounds)
         self.all_sprites.add(self.player)
-        self.level = Level(self.all_sprites, self.platforms)
+        self.level = Level(self.all_sprites, self.platforms, self.pools, self.rng)
         self.score = 0
-        # Iniciar música
-        pygame.mixer.music.play(loops=-1)
-        self.run()
+        self.frame = 0
+        self.playing = True
+        self.death_cause = None  # "fell" ou "enemy" quando a partida termina
+        # Renderizador por regiões sujas (opcional, ver RENDER_MODE)
+        if not self.headless and RENDER_MODE == "dirty":
+            self.renderer = DirtyRenderer(self.screen, self.level.background, self.atlas)
+        else:
+            self.renderer = None
+        self.rewind.clear()
+        self.start_snapshot = self.snapshot()
+    
+    def snapshot(self):
+        """Estado completo da simulação neste quadro (ver snapshot.py)"""
+        return capture(self)
+    
+    def restore(self, snap) -> None:
+        """Volta a simulação ao estado de um snapshot"""
+        restore(self, snap)
+        if self.renderer is not None:
+            self.renderer.invalidate()
+    
+    def retry(self) -> None:
+        """Recomeça a partida atual do início (mesma semente)"""
+        self.retry_requested = False
+        self.restore(self.start_snapshot)
+        self.rewind.clear()
     
     def run(self) -> None:
-        # Loop principal do jogo
+        # Loop principal com passo fixo: a simulação avança sempre 1/FPS por
+        # passo, independente da taxa de quadros; a tela desenha posições
+        # interpoladas entre os dois últimos passos.
+        recorder = RecordingInput(self.input)
+        # Depois de um retry o replay continua valendo: mesma semente, quadro 0
+        self.rewind.push(self.snapshot())
+        step_time = 1.0 / FPS
+        accumulator = 0.0
+        previous = time.perf_counter()
         self.playing = True
         while self.playing:
-            self.clock.tick(FPS)
+            self.clock.tick(RENDER_FPS)
+            profiler = self.profiler
+            if profiler is not None:
+                profiler.begin_frame()
+            now = time.perf_counter()
+            quality = self.quality
+            # Limita o atraso acumulado (máquina lenta ou janela arrastada)
+            accumulator += min(now - previous, step_time * MAX_STEPS_PER_FRAME)
+            previous = now
+            
             self.events()
-            self.update()
-            self.draw()
+            if profiler is not None:
+                profiler.lap("events")
+            if self.rewind_requested:
+                # Volta alguns segundos; o replay passa a seguir a nova linha do tempo
+                self.rewind_requested = False
+                self.restore(self.rewind.rewind(REWIND_SECONDS * FPS))
+                del recorder.inputs[self.frame:]
+                accumulator = 0.0
+            steps = 0
+            while accumulator >= step_time and self.playing:
+                self.step(recorder.poll())
+                self.rewind.push(self.snapshot())
+                if profiler is not None:
+                    profiler.lap("snapshot")
+                accumulator -= step_time
+                steps += 1
+                if steps >= MAX_STEPS_PER_FRAME:
+                    accumulator = 0.0
+                    break
+            if quality.should_present():
+                self.draw(accumulator / step_time if quality.interpolate else 1.0)
+            elif self.renderer is not None:
+                self.renderer.invalidate()  # O quadro pulado pode ter rolado a tela
+            quality.record((time.perf_counter() - now) * 1000)
+            if profiler is not None:
+                profiler.lap("draw")
+                profiler.steps = steps
+                profiler.end_frame(self.entity_counts())
+        self.last_replay = Replay(self.seed, recorder.inputs)
+        self.last_rank = None
+        if self.scores is not None and self.death_cause is not None:
+            # Só entra na fila do placar; a gravação acontece em outra thread
+            self.last_rank = self.scores.record(self.score, self.frame, self.seed, self.death_cause,
+                                                self.level.difficulty)
     
-    def update(self) -> None:
-        self.all_sprites.update()
-        
-        # Verifica colisão com plataformas para pulo automático
-        if self.player.vy > 0:  # Só verifica colisão se o jogador estiver caindo
-            hits = pygame.sprite.spritecollide(self.player, self.platforms, False)
-            for platform in hits:
-                # Confirma se o jogador está caindo e tocando a parte superior da plataforma
-                if self.player.rect.bottom <= platform.rect.top + 10:
-                    platform.on_collision(self.player)
-                    self.player.rect.bottom = platform.rect.top
-                    
-                    # Verifica se o jogador estava com power-up e agora pousou em uma plataforma
-                    if self.player.was_powered_up and not self.player.powered_up:
-                        self.player.was_powered_up = False
-                    
-                    # Desativa o estado de power-up quando pousa em uma plataforma
-                    if self.player.powered_up:
-                        self.player.powered_up = False
+    def play_replay(self, replay: Replay, realtime: bool = False) -> int:
+        """Reproduz um replay e retorna a pontuação final.
+
+        Por padrão roda na velocidade máxima (sem desenhar); com realtime=True
+        desenha a 60 FPS como uma partida normal.
+        """
+        self.reset(replay.seed)
+        source = ReplayInput(replay)
+        while self.playing and not source.finished:
+            if realtime:
+                self.clock.tick(FPS)
+                self.events()
+                if not self.running:
                     break
+            self.step(source.poll())
+            if realtime:
+                self.draw()
+        return self.score
+    
+    def step(self, inputs: int = 0) -> bool:
+        """Avança um quadro de simulação com os bits de controle dados.
+
+        Não desenha nem lê o teclado, então funciona em modo headless. Retorna
+        False quando a partida termina. Exemplo:
+
+            g = Game(headless=True)
+            g.reset()
+            while g.step(INPUT_RIGHT):
+                pass
+        """
+        self.player.controls = inputs
+        self.level.camera.begin_step()
+        self.update()
+        self.frame += 1
+        if self.spectators is not None:
+            self.spectators.publish(self)
+            if self.profiler is not None:
+                self.profiler.lap("broadcast")  # Fora da fase "snapshot", medida logo depois
+        return self.playing
+    
+    def end_run(self, cause: str) -> None:
+        """Fim de partida: som de game over e fim da música"""
+        self.death_cause = cause
+        self.sounds.play("game_over")
+        if not self.headless:
+            pygame.mixer.music.stop()
+        self.playing = False
+
+    def close(self) -> None:
+        """Ao sair do jogo: grava as partidas que ainda estão na fila do placar
+        e fecha a transmissão"""
+        if self.scores is not None:
+            self.scores.close()
+        if self.spectators is not None:
+            self.spectators.close()
+        if self.ghost is not None:
+            self.ghost.close()
+
+    def update(self) -> None:
+        profiler = self.profiler
+        self.level.update_sprites(self.player)
+        self.level.refresh_index()
+        if profiler is not None:
+            profiler.lap("sprites")
+        
+        # Colisões contínuas: testa o movimento do passo inteiro (prev -> atual).
+        # Plataformas e inimigos entram numa lista só, com os tempos calculados
+        # antes de qualquer resolução, e são resolvidos do mais cedo para o
+        # mais tarde: (t, 0 plataforma / 1 inimigo, ordem, sprite, pisão)
+        player = self.player
+        swept = swept_rect(player)
+        contacts = []
+        
+        # Plataformas para pulo automático: só se o jogador estiver caindo
+        if player.vy > 0:
+            for order, platform in enumerate(self.platforms.query(swept)):
+                t = landing_time(player, platform)
+                if t is not None:
+                    contacts.append((t, 0, order, platform, False))
+        
+        # Inimigos, usando o hitbox reduzido
+        for order, enemy in enumerate(self.level.enemies.query(swept)):
+            overlapping = player.rect.colliderect(enemy.hitbox)
+            if not overlapping and not swept.colliderect(swept_rect(enemy)):
+                continue  # Nem os caminhos dos dois se cruzam
+            hit = hit_time(player, enemy)
+            if hit is not None:
+                contacts.append((hit[0], 1, order, enemy, hit[1]))
+            elif overlapping:
+                # Sem tempo de entrada (já se tocavam): regra do fim do passo para o pisão
+                stomp = player.rect.bottom <= enemy.hitbox.top + STOMP_TOLERANCE
+                contacts.append((1.0, 1, order, enemy, stomp))
+        contacts.sort(key=lambda c: c[:3])
+        
+        limit = 1.0  # Depois de um pouso ou pisão o resto do movimento não acontece
+        for t, kind, _, other, stomp in contacts:
+            if t > limit or not self.playing:
+                break
+            if kind == 0:
+                if player.vy <= 0:
+                    continue  # Já foi lançado para cima por um contato anterior
+                limit = t
+                other.on_collision(player)
+                player.land(other.rect.top)
+                
+                # Verifica se o jogador estava com power-up e agora pousou em uma plataforma
+                if player.was_powered_up and not player.powered_up:
+                    player.was_powered_up = False
+                
+                # Desativa o estado de power-up quando pousa em uma plataforma
+                if player.powered_up:
+                    player.powered_up = False
+                continue
+            
+            # Descendo (após o auge do pulo) o power-up já não protege
+            if player.vy > 0 and player.powered_up:
+                player.powered_up = False
+            # Se o jogador pula em cima do inimigo (está caindo e toca a parte superior)
+            if player.vy > 0 and stomp:
+                # Destrói o inimigo e faz o jogador pular
+                limit = t
+                other.kill()
+                player.jump(boost=1.2)
+            # Se o jogador colide com o inimigo de lado ou por baixo, mas está com power-up ativo
+            # ou já teve power-up mas ainda não pousou em plataforma, ignora o game over
+            elif player.powered_up or player.was_powered_up:
+                continue
+            else:
+                # O jogador colide com o inimigo de lado ou por baixo - game over
+                self.end_run("enemy")
         
         # Verificar se o jogador está descendo (após o auge do pulo)
         # Isso desativa o estado powered_up após o auge do pulo
-        if self.player.vy > 0 and self.player.powered_up:
-            self.player.powered_up = False
-        
-        # Verificar colisão com inimigos usando o hitbox reduzido
-        if hasattr(self.level, 'enemies'):
-            for enemy in self.level.enemies:
-                # Verificar colisão entre o retângulo do jogador e o hitbox do inimigo
-                if self.player.rect.colliderect(enemy.hitbox):
-                    # Se o jogador pula em cima do inimigo (está caindo e toca a parte superior)
-                    if self.player.vy > 0 and self.player.rect.bottom <= enemy.hitbox.top + 15:
-                        # Destrói o inimigo e faz o jogador pular
-                        enemy.kill()
-                        self.player.jump(boost=1.2)
-                    # Se o jogador colide com o inimigo de lado ou por baixo, mas está com power-up ativo
-                    # ou já teve power-up mas ainda não pousou em plataforma, ignora o game over
-                    elif self.player.powered_up or self.player.was_powered_up:
-                        continue
-                    else:
-                        # O jogador colide com o inimigo de lado ou por baixo - game over
-                        self.game_over_sound.play()
-                        pygame.mixer.music.stop()
-                        self.playing = False
+        if player.vy > 0 and player.powered_up:
+            player.powered_up = False
+        if profiler is not None:
+            profiler.lap("collisions")
         
         # Atualiza o nível após processar colisões
         self.level.update(self.player)
@@ -109,11 +414,29 @@ class Game:
         # Atualizar pontuação usando a pontuação exibida, não a altura total
         self.score = self.level.displayed_score
         
-        # Verifica se o jogador caiu
-        if self.player.rect.top > SCREEN_HEIGHT:
-            self.game_over_sound.play()
-            pygame.mixer.music.stop()
-            self.playing = False
+        # Verifica se o jogador caiu (abaixo da área visível da câmera)
+        if self.level.camera.to_screen_y(self.player.y) > SCREEN_HEIGHT:
+            self.end_run("fell")
+        if profiler is not None:
+            profiler.lap("level")
+    
+    def entity_counts(self) -> dict:
+        """Entidades vivas por grupo (para o profiler achar vazamentos)"""
+        level = self.level
+        return {
+            "sprites": len(self.all_sprites),
+            "platforms": len(self.platforms),
+            "powerups": len(level.powerups),
+            "enemies": len(level.enemies),
+            "updating": len(level.updating),
+            "pool_free": sum(len(pool.free) for pool in level.pools.values()),
+        }
+    
+    def toggle_profiler(self) -> None:
+        """F3: mostra/esconde o painel do profiler (ligando o profiler se preciso)"""
+        if self.profiler is None:
+            self.profiler = FrameProfiler()
+        self.show_profiler = not self.show_profiler
     
     def events(self) -> None:
         for event in pygame.event.get():
@@ -121,30 +444,69 @@ class Game:
             if event.type == pygame.QUIT:
                 self.playing = False
                 self.running = False
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.toggle_profiler()
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F11 and SCALED_DISPLAY:
+                pygame.display.toggle_fullscreen()
+            if event.type in (pygame.WINDOWSIZECHANGED, pygame.WINDOWEXPOSED) and self.renderer is not None:
+                # Janela redimensionada (ou tela cheia) ou descoberta: o próximo quadro é completo
+                self.renderer.invalidate()
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_BACKSPACE:
+                self.rewind_requested = True
     
     def get_font_size(self, base_size: int) -> int:
         """Calcula um tamanho de fonte proporcional à largura da tela"""
-        # Usando 400 como largura de referência (a largura atual da tela)
+        # Usando 400 como largura de referência; é a largura da superfície
+        # lógica, então o tamanho da janela (SCALED) não muda as fontes
         scale_factor = SCREEN_WIDTH / 400
         return int(base_size * scale_factor)
     
-    def draw(self) -> None:
+    def ghost_rect(self, alpha: float = 1.0) -> pygame.Rect:
+        """Retângulo na tela do jogador fantasma, ou None se não há o que desenhar"""
+        if self.ghost is None or not self.ghost.visible:
+            return None
+        x, y = self.ghost.state.player
+        camera = self.level.camera
+        cam_y = camera.prev_y + (camera.y - camera.prev_y) * alpha
+        rect = self.ghost_image.get_rect(topleft=(x, round(y - cam_y)))
+        return rect if rect.colliderect(self.screen.get_rect()) else None
+    
+    def draw(self, alpha: float = 1.0) -> None:
+        """Desenha o quadro; alpha interpola entre o passo anterior e o atual"""
+        camera = self.level.camera
+        # Com o painel do profiler visível o quadro é sempre completo
+        overlay = self.show_profiler and self.profiler is not None
+        ghost = self.ghost_rect(alpha)
+        if self.renderer is not None and not overlay:
+            entries = [(sprite, sprite.image, camera.apply(sprite, alpha)) for sprite in self.level.visible_sprites()]
+            if ghost is not None:
+                entries.append(("ghost", self.ghost_image, ghost))
+            self.renderer.draw(entries, self.score_hud, self.score, (10, 10), camera.moving)
+            return
+        
         # Desenha o fundo
         self.level.draw_background(self.screen)
         
-        # Desenha todos os sprites
-        self.all_sprites.draw(self.screen)
+        # Desenha os sprites visíveis (posição na tela vem da câmera)
+        self.level.draw_sprites(self.screen, alpha, self.atlas)
+        if ghost is not None:
+            self.screen.blit(self.ghost_image, ghost)
         
         # Desenha a HUD (pontuação) com fonte Arial
-        score_font = pygame.font.SysFont("arial", self.get_font_size(16))
-        score_text = score_font.render(f"Pontuação: {self.score}", True, WHITE)
-        self.screen.blit(score_text, (10, 10))
+        self.score_hud.draw(self.screen, self.score, (10, 10))
+        
+        if overlay:
+            if self.profiler_overlay is None:
+                self.profiler_overlay = ProfilerOverlay(self.text.font("arial", self.get_font_size(12)))
+            self.profiler_overlay.draw(self.screen, self.profiler)
+            if self.renderer is not None:
+                self.renderer.invalidate()
         
         pygame.display.flip()
     
-    def draw_text(self, text: str, size: int, color: tuple, x: int, y: int, align: str = "midtop") -> None:
-        font = pygame.font.Font(self.font_name, size)
-        text_surface = font.render(text, True, color)
+    def draw_text(self, text: str, size: int, color: tuple, x: int, y: int, align: str = "midtop",
+                  surface: pygame.Surface = None) -> None:
+        text_surface = self.text.render(text, self.font_name, size, color)
         text_rect = text_surface.get_rect()
         
         if align == "midtop":
@@ -154,21 +516,34 @@ class Game:
         elif align == "center":
             text_rect.center = (x, y)
             
-        self.screen.blit(text_surface, text_rect)
+        (surface if surface is not None else self.screen).blit(text_surface, text_rect)
+    
+    def game_over_layer(self) -> pygame.Surface:
+        """Partes fixas da tela de game over, compostas uma vez só"""
+        if self.game_over_static is None:
+            layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+            layer.fill(BLACK)
+            # Centraliza "GAME OVER" mais ao centro da tela
+            self.draw_text("GAME OVER", self.get_font_size(36), WHITE, SCREEN_WIDTH//2, SCREEN_HEIGHT * 0.12, surface=layer)
+            self.draw_text("Recordes", self.get_font_size(18), WHITE, SCREEN_WIDTH//2, SCREEN_HEIGHT * 0.34, surface=layer)
+            # Posiciona as instruções mais abaixo
+            self.draw_text("Pressione SPACE para jogar novamente", self.get_font_size(18), WHITE,
+                          SCREEN_WIDTH//2, SCREEN_HEIGHT * 0.67, surface=layer)
+            self.draw_text("R para tentar a mesma fase", self.get_font_size(18), WHITE,
+                          SCREEN_WIDTH//2, SCREEN_HEIGHT * 0.75, surface=layer)
+            self.draw_text("ou ESC para sair", self.get_font_size(18), WHITE,
+                          SCREEN_WIDTH//2, SCREEN_HEIGHT * 0.83, surface=layer)
+            self.game_over_static = layer
+        return self.game_over_static
     
     def show_game_over(self) -> None:
-        self.screen.fill(BLACK)
-        
-        # Centraliza "GAME OVER" mais ao centro da tela
-        self.draw_text("GAME OVER", self.get_font_size(36), WHITE, SCREEN_WIDTH//2, SCREEN_HEIGHT * 0.33)
+        self.screen.blit(self.game_over_layer(), (0, 0))
         
         # Cria ambos os textos primeiro para calcular o tamanho total
-        font = pygame.font.Font(self.font_name, self.get_font_size(26))
-        pontuacao_text = font.render("Pontuação: ", True, WHITE)
+        pontuacao_text = self.text.render("Pontuação: ", self.font_name, self.get_font_size(26), WHITE)
         pontuacao_width = pontuacao_text.get_width()
         
-        score_font = pygame.font.SysFont("arial", self.get_font_size(26))
-        score_text = score_font.render(f"{self.score}", True, WHITE)
+        score_text = self.text.render(f"{self.score}", "arial", self.get_font_size(26), WHITE)
         score_width = score_text.get_width()
         
         # Calcula a largura total e a posição inicial para centralizar
@@ -176,34 +551,55 @@ class Game:
         start_x = (SCREEN_WIDTH - total_width) // 2
         
         # Posiciona os textos lado a lado a partir da posição inicial
-        pontuacao_rect = pontuacao_text.get_rect(topleft=(start_x, SCREEN_HEIGHT * 0.5 - pontuacao_text.get_height() // 2))
-        score_rect = score_text.get_rect(topleft=(start_x + pontuacao_width, SCREEN_HEIGHT * 0.5 - score_text.get_height() // 2))
+        pontuacao_rect = pontuacao_text.get_rect(topleft=(start_x, SCREEN_HEIGHT * 0.26 - pontuacao_text.get_height() // 2))
+        score_rect = score_text.get_rect(topleft=(start_x + pontuacao_width, SCREEN_HEIGHT * 0.26 - score_text.get_height() // 2))
         
         # Exibe os textos
         self.screen.blit(pontuacao_text, pontuacao_rect)
         self.screen.blit(score_text, score_rect)
-        
-        # Posiciona as instruções mais abaixo
-        self.draw_text("Pressione SPACE para jogar novamente", self.get_font_size(18), WHITE, 
-                      SCREEN_WIDTH//2, SCREEN_HEIGHT * 0.67)
-        self.draw_text("ou ESC para sair", self.get_font_size(18), WHITE, 
-                      SCREEN_WIDTH//2, SCREEN_HEIGHT * 0.75)
+        self.draw_leaderboard()
         
         pygame.display.flip()
+        frame = self.screen.copy()
         
+        # Nada se move nesta tela: dorme até chegar um evento
         waiting = True
         while waiting and self.running:
-            self.clock.tick(FPS//2)
-            for event in pygame.event.get():
+            for event in self.wait_events():
                 if event.type == pygame.QUIT:
                     waiting = False
                     self.running = False
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE:
                         waiting = False
+                    elif event.key == pygame.K_r:
+                        self.retry_requested = True
+                        waiting = False
                     elif event.key == pygame.K_ESCAPE:
                         waiting = False
                         self.running = False
+                if event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWSIZECHANGED):
+                    # A janela foi coberta/restaurada: reenvia o quadro
+                    self.screen.blit(frame, (0, 0))
+                    pygame.display.flip()
+    
+    def draw_leaderboard(self) -> None:
+        """Melhores partidas, lidas do cache em memória do placar (sem acessar o disco)"""
+        if self.scores is None:
+            return
+        causes = {"fell": "queda", "enemy": "inimigo"}
+        for i, (score, _, _, cause) in enumerate(self.scores.top()):
+            color = GREEN if i + 1 == self.last_rank else WHITE
+            # Números em Arial, como a pontuação (a fonte do jogo não tem todos os dígitos)
+            line = self.text.render(f"{i + 1}.  {score}  ({causes.get(cause, '-')})", "arial", self.get_font_size(16), color)
+            self.screen.blit(line, line.get_rect(midtop=(SCREEN_WIDTH//2, SCREEN_HEIGHT * (0.40 + i * 0.045))))
+    
+    def wait_events(self) -> list:
+        """Bloqueia até chegar um evento (ou IDLE_WAIT_MS) e retorna os pendentes"""
+        event = pygame.event.wait(IDLE_WAIT_MS)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
     
     def create_button(self, text, size, color, x, y, width, height, hover_color=None):
         """Cria um botão interativo com efeito hover"""
@@ -217,19 +613,48 @@ class Game:
             'is_hover': False
         }
     
-    def draw_button(self, button):
-        """Desenha um botão na tela"""
+    def draw_button(self, button, surface: pygame.Surface = None):
+        """Desenha um botão na tela (ou em outra superfície do mesmo tamanho)"""
+        if surface is None:
+            surface = self.screen
         color = button['hover_color'] if button['is_hover'] else button['color']
         
         # Desenhar fundo do botão com bordas arredondadas
-        pygame.draw.rect(self.screen, color, button['rect'], border_radius=10)
-        pygame.draw.rect(self.screen, WHITE, button['rect'], 2, border_radius=10)
+        pygame.draw.rect(surface, color, button['rect'], border_radius=10)
+        pygame.draw.rect(surface, WHITE, button['rect'], 2, border_radius=10)
         
         # Desenhar texto
-        font = pygame.font.Font(self.font_name, button['size'])
-        text_surf = font.render(button['text'], True, WHITE)
+        text_surf = self.text.render(button['text'], self.font_name, button['size'], WHITE)
         text_rect = text_surf.get_rect(center=button['rect'].center)
-        self.screen.blit(text_surf, text_rect)
+        surface.blit(text_surf, text_rect)
+    
+    def start_screen_layers(self, buttons: list) -> tuple:
+        """Fundo fixo do menu e a imagem de cada botão em cada estado de hover"""
+        static = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        # Fundo
+        if self.menu_background:
+            static.blit(self.menu_background, (0, 0))
+        else:
+            static.fill(BLACK)
+        
+        # Título com efeito de sombra - tamanho proporcional
+        self.draw_text("DOODLE JUMP", self.get_font_size(38), BLACK, SCREEN_WIDTH//2 + 3, 123, surface=static)
+        self.draw_text("DOODLE JUMP", self.get_font_size(38), WHITE, SCREEN_WIDTH//2, 120, surface=static)
+        
+        # Instruções do jogo (agora com cor preta)
+        self.draw_text("Use as setas ← → para mover", self.get_font_size(14), BLACK, SCREEN_WIDTH//2, SCREEN_HEIGHT - 100, surface=static)
+        self.draw_text("Pule nas plataformas e não caia!", self.get_font_size(14), BLACK, SCREEN_WIDTH//2, SCREEN_HEIGHT - 70, surface=static)
+        
+        # Cada botão desenhado sobre o fundo, recortado no seu retângulo
+        states = {}
+        for button in buttons:
+            for hover in (False, True):
+                layer = static.copy()
+                button['is_hover'] = hover
+                self.draw_button(button, layer)
+                states[(button['text'], hover)] = layer.subsurface(button['rect']).copy()
+            button['is_hover'] = False
+        return static, states
     
     def show_start_screen(self) -> None:
         # Criar botões para o menu com fontes proporcionais
@@ -242,23 +667,23 @@ class Game:
                                         200, 50, (220, 120, 120))
         
         buttons = [start_button, exit_button]
+        static, states = self.start_screen_layers(buttons)
         
-        # Carregar possível som de hover
-        try:
-            hover_sound = pygame.mixer.Sound(os.path.join(SND_DIR, "menu_hover.wav"))
-            hover_sound.set_volume(0.2)
-            has_hover_sound = True
-        except:
-            has_hover_sound = False
+        def redraw_all() -> None:
+            self.screen.blit(static, (0, 0))
+            for button in buttons:
+                self.screen.blit(states[(button['text'], button['is_hover'])], button['rect'])
+            pygame.display.flip()
         
-        last_hover_state = {b['text']: False for b in buttons}
+        mouse_pos = pygame.mouse.get_pos()
+        for button in buttons:
+            button['is_hover'] = button['rect'].collidepoint(mouse_pos)
+        redraw_all()
         
+        # Só redesenha quando o hover muda; parado, dorme em wait_events()
         waiting = True
         while waiting:
-            self.clock.tick(FPS)
-            mouse_pos = pygame.mouse.get_pos()
-            
-            for event in pygame.event.get():
+            for event in self.wait_events():
                 if event.type == pygame.QUIT:
                     waiting = False
                     self.running = False
@@ -266,6 +691,8 @@ class Game:
                     if event.key == pygame.K_ESCAPE:
                         waiting = False
                         self.running = False
+                if event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN):
+                    mouse_pos = event.pos
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     for button in buttons:
                         if button['rect'].collidepoint(mouse_pos):
@@ -274,31 +701,22 @@ class Game:
                             elif button['text'] == "SAIR":
                                 waiting = False
                                 self.running = False
+                if event.type == pygame.WINDOWLEAVE:
+                    mouse_pos = (-1, -1)
+                if event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWSIZECHANGED):
+                    redraw_all()
             
-            # Fundo
-            if self.menu_background:
-                self.screen.blit(self.menu_background, (0, 0))
-            else:
-                self.screen.fill(BLACK)
-            
-            # Título com efeito de sombra - tamanho proporcional
-            self.draw_text("DOODLE JUMP", self.get_font_size(38), BLACK, SCREEN_WIDTH//2 + 3, 123)
-            self.draw_text("DOODLE JUMP", self.get_font_size(38), WHITE, SCREEN_WIDTH//2, 120)
-            
-            # Atualizar estado de hover dos botões
+            # Atualizar estado de hover dos botões (só os que mudaram são redesenhados)
+            dirty = []
             for button in buttons:
-                old_hover = button['is_hover']
-                button['is_hover'] = button['rect'].collidepoint(mouse_pos)
-                
+                hover = button['rect'].collidepoint(mouse_pos)
+                if hover == button['is_hover']:
+                    continue
+                button['is_hover'] = hover
                 # Tocar som quando hover começa
-                if has_hover_sound and not old_hover and button['is_hover'] and not last_hover_state[button['text']]:
-                    hover_sound.play()
-                
-                last_hover_state[button['text']] = button['is_hover']
-                self.draw_button(button)
-            
-            # Instruções do jogo (agora com cor preta)
-            self.draw_text("Use as setas ← → para mover", self.get_font_size(14), BLACK, SCREEN_WIDTH//2, SCREEN_HEIGHT - 100)
-            self.draw_text("Pule nas plataformas e não caia!", self.get_font_size(14), BLACK, SCREEN_WIDTH//2, SCREEN_HEIGHT - 70)
-            
-            pygame.display.flip()
+                if hover:
+                    self.sounds.play("menu_hover")
+                self.screen.blit(states[(button['text'], hover)], button['rect'])
+                dirty.append(button['rect'])
+            if dirty:
+                pygame.display.update(dirty)
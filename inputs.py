@@ -0,0 +1,78 @@
+import pygame
+from settings import INPUT_LEFT, INPUT_RIGHT
+
+
+class InputSource:
+    """Fonte dos bits de controle do jogador, lida uma vez por quadro de simulação"""
+
+    finished = False  # True quando uma fonte finita (replay, roteiro) acabou
+
+    def poll(self) -> int:
+        raise NotImplementedError
+
+
+class KeyboardInput(InputSource):
+    """Teclado ao vivo (setas esquerda/direita)"""
+
+    def poll(self) -> int:
+        keys = pygame.key.get_pressed()
+        controls = 0
+        if keys[pygame.K_LEFT]:
+            controls |= INPUT_LEFT
+        if keys[pygame.K_RIGHT]:
+            controls |= INPUT_RIGHT
+        return controls
+
+
+class ScriptedInput(InputSource):
+    """Entrada programada: uma sequência de bits por quadro ou uma função frame -> bits"""
+
+    def __init__(self, script) -> None:
+        self.script = script
+        self.frame = 0
+
+    def poll(self) -> int:
+        if callable(self.script):
+            controls = self.script(self.frame)
+        elif self.frame < len(self.script):
+            controls = self.script[self.frame]
+        else:
+            controls = 0
+            self.finished = True
+        self.frame += 1
+        return controls
+
+
+class ReplayInput(InputSource):
+    """Reproduz os controles gravados em um Replay"""
+
+    def __init__(self, replay) -> None:
+        self.inputs = replay.inputs
+        self.frame = 0
+
+    def poll(self) -> int:
+        if self.frame >= len(self.inputs):
+            self.finished = True
+            return 0
+        controls = self.inputs[self.frame]
+        self.frame += 1
+        if self.frame >= len(self.inputs):
+            self.finished = True
+        return controls
+
+
+class RecordingInput(InputSource):
+    """Repassa outra fonte e grava cada quadro lido"""
+
+    def __init__(self, source: InputSource) -> None:
+        self.source = source
+        self.inputs = bytearray()
+
+    @property
+    def finished(self) -> bool:
+        return self.source.finished
+
+    def poll(self) -> int:
+        controls = self.source.poll()
+        self.inputs.append(controls)
+        return controls
@@ -1,75 +1,97 @@
 import pygame
 import random
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, IMG_DIR
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, ENTITY_BACKEND
+from settings import (CHUNK_LOOKAHEAD, CHUNK_THREAD, DIFFICULTY_STEP,
+                      ENEMY_BASE_CHANCE, ENEMY_CHANCE_PER_LEVEL, ENEMY_MAX_EXTRA_CHANCE)
+from assets import assets
+from camera import Camera
+from chunks import Chunk, ChunkStreamer, chunk_bottom
+from pool import Pool
+from spatial import BucketGroup
+import movers
 from sprites import Platform, MovingPlatform, BreakingPlatform, PowerUp, FlyingEnemy
 
+def make_pools() -> dict:
+    """Um pool por tipo de sprite gerado pelo nível"""
+    return {
+        "normal": Pool(Platform),
+        "moving": Pool(MovingPlatform),
+        "breaking": Pool(BreakingPlatform),
+        "powerup": Pool(PowerUp),
+        "enemy": Pool(FlyingEnemy),
+    }
+
 class Level:
-    def __init__(self, all_sprites: pygame.sprite.Group, platforms: pygame.sprite.Group) -> None:
+    # Se True, cada plataforma criada é anotada em self.history (para análise offline)
+    record_history = False
+    
+    def __init__(self, all_sprites: pygame.sprite.Group, platforms: pygame.sprite.Group, pools: dict = None,
+                 rng: random.Random = None, backend: str = ENTITY_BACKEND) -> None:
         self.all_sprites = all_sprites
         self.platforms = platforms
-        self.powerups = pygame.sprite.Group()
-        self.enemies = pygame.sprite.Group()  # Novo grupo para inimigos
+        # Gerador aleatório da partida (com semente, para partidas reproduzíveis)
+        self.rng = rng if rng is not None else random.Random()
+        # Pools podem ser compartilhados entre partidas (ver Game.new)
+        self.pools = pools if pools is not None else make_pools()
+        # Grupos com índice vertical: colisões só olham as faixas perto do jogador
+        self.powerups = BucketGroup()
+        self.enemies = BucketGroup()  # Novo grupo para inimigos
+        # Sprites que precisam de update() a cada passo (plataformas fixas e
+        # power-ups não mudam sozinhos e ficam de fora)
+        self.updating = pygame.sprite.Group()
+        # Backend vetorizado opcional para plataformas móveis e inimigos
+        if backend == "numpy" and movers.available():
+            self.movers = movers.MoverArrays(self.rng.getrandbits(64), bucket_height=self.enemies.bucket_height)
+        else:
+            self.movers = None
         self.max_score = 0
         self.total_height_climbed = 0  # Adiciona contador de altura total escalada
         self.displayed_score = 0  # Novo atributo para controlar a pontuação exibida
-        self.background = pygame.image.load(f"{IMG_DIR}/background.png").convert()
-        self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.platform_count = 0  # Contador para controlar as primeiras plataformas
+        self.background = assets.image("background")
+        self.platform_count = 0  # Plataformas colocadas no nível até agora
         self.difficulty = 0  # Controla a dificuldade do jogo
+        self.scrolled = False  # Indica se a tela rolou no último update
+        self.camera = Camera()  # Rolagem da tela = mover a câmera, não os sprites
+        self.history = [] if self.record_history else None  # (tipo, x, y) de cada plataforma
 
-        # Criar a primeira plataforma diretamente sob o jogador
-        p = Platform(SCREEN_WIDTH // 2 - 35, 500)
-        self.all_sprites.add(p)
-        self.platforms.add(p)
-        self.platform_count += 1
-        last_y = 500
-        last_x = p.rect.x  # Armazena o x da última plataforma
+        # Conteúdo do nível em chunks pré-gerados (função pura da semente +
+        # índice do chunk); aqui só se copiam os registros para sprites dos pools
+        self.streamer = ChunkStreamer(self.rng.getrandbits(63), CHUNK_LOOKAHEAD, CHUNK_THREAD)
+        self.stream_chunks()
 
-        # Gerar as próximas 10 plataformas
-        for i in range(10):
-            y = last_y - random.randint(50, 70)
-            p = self.create_platform(y, last_x)
-            last_y = p.rect.y
-            last_x = p.rect.x
+    def stream_chunks(self) -> None:
+        """Coloca no nível os chunks que estão a menos de meia tela acima da câmera"""
+        limit = self.camera.top - SCREEN_HEIGHT // 2
+        while chunk_bottom(self.streamer.next_index) > limit:
+            self.splice(self.streamer.take())
+        self.streamer.refill()
 
-    def create_platform(self, y: int, last_x: int = None) -> Platform:
-        width = 70
-        # Calcula o x baseado no last_x se fornecido, caso contrário, define aleatoriamente
-        if last_x is not None:
-            delta = random.randint(-50, 50)
-            x = last_x + delta
-            x = max(0, min(x, SCREEN_WIDTH - width))
-        else:
-            x = random.randrange(0, SCREEN_WIDTH - width)
-        
-        # As primeiras 3 plataformas sempre serão normais
-        if self.platform_count < 3:
-            p = Platform(x, y)
-        else:
-            platform_type = random.random()
-            if platform_type < 0.15 and y < 400:
-                p = MovingPlatform(x, y)
-            elif platform_type < 0.30 and y < 300:
-                p = BreakingPlatform(x, y)
+    def splice(self, chunk: Chunk) -> None:
+        """Cria os sprites de um chunk a partir dos pools"""
+        for kind, x, y, vx in chunk.platforms:
+            if kind == "moving":
+                p = self.pools["moving"].acquire(x, y, vx=vx)
+                self.add_mover(p, movers.KIND_PLATFORM)
+            elif kind == "breaking":
+                p = self.pools["breaking"].acquire(x, y)
+                self.updating.add(p)
             else:
-                p = Platform(x, y)
-        
-        self.platform_count += 1
-        self.all_sprites.add(p)
-        self.platforms.add(p)
-        
-        # Chance de adicionar power-up em plataformas normais
-        if self.platform_count >= 3 and random.random() < 0.1 and y < 200:
-            pu_type = "spring" if random.random() < 0.7 else "jetpack"
-            pu = PowerUp(x + width//2, y, pu_type)
+                p = self.pools["normal"].acquire(x, y)
+            self.all_sprites.add(p)
+            self.platforms.add(p)
+            if self.history is not None:
+                self.history.append((kind, x, y))
+        self.platform_count += len(chunk.platforms)
+
+        for pu_type, x, y in chunk.powerups:
+            pu = self.pools["powerup"].acquire(x, y, pu_type)
             self.all_sprites.add(pu)
             self.powerups.add(pu)
-        
-        return p  # Retorna a plataforma criada
 
     def update(self, player: 'Player') -> None:
-        # Se o jogador ultrapassar metade da tela, mover plataformas para baixo
-        if player.rect.top <= SCREEN_HEIGHT / 2:
+        # Se o jogador ultrapassar metade da tela, a câmera sobe (O(1), nada é movido)
+        self.scrolled = self.camera.to_screen_y(player.y) <= SCREEN_HEIGHT / 2
+        if self.scrolled:
             # Calcular o deslocamento vertical
             offset = abs(player.vy)
             
@@ -77,19 +99,14 @@ class Level:
             self.total_height_climbed += offset
             
             # Aumenta a dificuldade baseado na altura
-            self.difficulty = int(self.total_height_climbed / 1000)
+            self.difficulty = int(self.total_height_climbed / DIFFICULTY_STEP)
             
-            player.rect.y += offset
-            for sprite in self.all_sprites.sprites():
-                if sprite != player:
-                    sprite.rect.y += offset
-                    # Remover sprites que saem da tela
-                    if sprite.rect.top >= SCREEN_HEIGHT:
-                        sprite.kill()
-            self.generate_platforms()
+            self.camera.scroll(offset)
+            self.despawn(player)
+            self.stream_chunks()
             
             # Gerar inimigos com base na dificuldade
-            if random.random() < 0.01 + min(0.05, self.difficulty * 0.005):
+            if self.rng.random() < ENEMY_BASE_CHANCE + min(ENEMY_MAX_EXTRA_CHANCE, self.difficulty * ENEMY_CHANCE_PER_LEVEL):
                 self.generate_enemy()
         
         # Calcula a pontuação real (arredondada para baixo)
@@ -105,30 +122,83 @@ class Level:
             self.max_score = self.displayed_score
         
         # Verificar colisão com power-ups
-        powerup_hits = pygame.sprite.spritecollide(player, self.powerups, True)
+        powerup_hits = self.powerups.collide(player.rect)
+        for powerup in powerup_hits:
+            powerup.kill()
         for powerup in powerup_hits:
             powerup.apply_effect(player)
     
     def generate_enemy(self) -> None:
         """Gera um novo inimigo voador em uma posição aleatória no topo da tela"""
-        x = random.randint(40, SCREEN_WIDTH - 40)
-        y = random.randint(-50, 0)  # Ligeiramente acima da tela visível
+        x = self.rng.randint(40, SCREEN_WIDTH - 40)
+        y = self.camera.to_world_y(self.rng.randint(-50, 0))  # Ligeiramente acima da tela visível
         
-        enemy = FlyingEnemy(x, y)
+        enemy = self.pools["enemy"].acquire(x, y, self.rng)
         self.all_sprites.add(enemy)
         self.enemies.add(enemy)
+        self.add_mover(enemy, movers.KIND_ENEMY)
+    
+    def add_mover(self, sprite: pygame.sprite.Sprite, kind: int) -> None:
+        """Registra um sprite móvel no backend vetorizado ou no grupo de update()"""
+        if self.movers is not None:
+            self.movers.add(sprite, kind)
+        else:
+            self.updating.add(sprite)
+    
+    def update_sprites(self, player: 'Player') -> None:
+        """Avança todos os sprites um passo (o jogador primeiro, como antes)"""
+        player.update()
+        self.updating.update()
+        if self.movers is not None:
+            self.movers.step()
+    
+    def despawn(self, player: 'Player') -> None:
+        """Remove os sprites que já saíram por baixo da área visível"""
+        # Só as faixas do índice abaixo da câmera precisam ser verificadas
+        bottom = self.camera.bottom
+        for group in (self.platforms, self.powerups, self.enemies):
+            for sprite in group.sprites_below(bottom):
+                if self.camera.is_below_view(sprite.rect):
+                    sprite.kill()
+    
+    def refresh_index(self) -> None:
+        """Atualiza o índice dos sprites que se movem na vertical (inimigos)"""
+        if self.movers is not None:
+            # O backend vetorizado já sabe quais mudaram de faixa
+            for sprite in self.movers.rebucketed:
+                if sprite in self.enemies:
+                    self.enemies.relocate(sprite)
+        else:
+            self.enemies.refresh()
+    
+    def clear(self, player: 'Player' = None) -> None:
+        """Devolve todos os sprites do nível aos pools (usado ao reiniciar)"""
+        for sprite in self.all_sprites.sprites():
+            if sprite is not player:
+                sprite.kill()
+        self.streamer.stop()
+    
+    def pool_stats(self) -> dict:
+        """Estatísticas de cada pool; em regime 'created' para de crescer"""
+        return {name: pool.stats() for name, pool in self.pools.items()}
+    
+    def visible_sprites(self) -> list:
+        """Sprites que intersectam a área visível da câmera"""
+        return [s for s in self.all_sprites if self.camera.is_visible(s.rect)]
     
-    def generate_platforms(self) -> None:
-        # Encontrar a plataforma com menor y (mais alta)
-        min_plat = min(self.platforms, key=lambda p: p.rect.y)
-        min_y = min_plat.rect.y
-        x_hint = min_plat.rect.x
-        while len(self.platforms) < 8:
-            new_y = min_y - random.randint(50, 70)
-            new_plat = self.create_platform(new_y, x_hint)
-            min_y = new_plat.rect.y
-            x_hint = new_plat.rect.x
-            
     def draw_background(self, screen: pygame.Surface) -> None:
         # Desenha o background
         screen.blit(self.background, (0, 0))
+    
+    def draw_sprites(self, screen: pygame.Surface, alpha: float = 1.0, atlas=None) -> None:
+        """Desenha os sprites visíveis convertendo mundo -> tela pela câmera.
+
+        Com um atlas (atlas.TextureAtlas) é um só blits() recortando dele.
+        """
+        apply = self.camera.apply
+        if atlas is None:
+            screen.blits([(s.image, apply(s, alpha)) for s in self.visible_sprites()], doreturn=False)
+            return
+        source, areas = atlas.surface, atlas.areas
+        screen.blits([(source, apply(s, alpha), areas[s.image]) for s in self.visible_sprites()],
+                     doreturn=False)
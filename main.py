@@ -1,10 +1,51 @@
+import argparse
 from game import Game
+from replay import Replay
+from profiler import FrameProfiler
+from spectate import SpectatorServer, GhostClient
+from settings import SPECTATOR_HOST, SPECTATOR_PORT
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Doodle Jump")
+    parser.add_argument("--record", metavar="ARQUIVO", help="grava o replay de cada partida neste arquivo")
+    parser.add_argument("--replay", metavar="ARQUIVO", help="reproduz um replay gravado e sai")
+    parser.add_argument("--realtime", action="store_true", help="com --replay, mostra a partida a 60 FPS")
+    parser.add_argument("--profile", metavar="ARQUIVO", help="mede cada quadro e salva em CSV ou JSON ao sair")
+    parser.add_argument("--serve", action="store_true", help="transmite as partidas para espectadores locais")
+    parser.add_argument("--ghost", metavar="HOST:PORTA", nargs="?", const=f"{SPECTATOR_HOST}:{SPECTATOR_PORT}",
+                        help="corre contra o fantasma da partida transmitida")
+    return parser.parse_args()
 
 if __name__ == "__main__":
-    g = Game()
-    g.show_start_screen()  # nova tela de início para Start/Sair
-    
-    while g.running:
-        g.new()
-        if g.running:  # Verifica se não saiu durante o jogo
-            g.show_game_over()
+    args = parse_args()
+
+    if args.replay:
+        # Reprodução na velocidade máxima (headless) ou em tempo real na janela
+        replay = Replay.load(args.replay)
+        g = Game(headless=not args.realtime)
+        score = g.play_replay(replay, realtime=args.realtime)
+        print(f"Replay: semente {replay.seed}, {g.frame} quadros, pontuação {score}")
+    else:
+        g = Game()
+        if args.profile:
+            g.profiler = FrameProfiler(record=True)
+        if args.serve:
+            g.spectators = SpectatorServer()
+        if args.ghost:
+            host, _, port = args.ghost.rpartition(":")
+            g.ghost = GhostClient(host or SPECTATOR_HOST, int(port))
+        if g.running:
+            g.show_start_screen()  # nova tela de início para Start/Sair
+
+        while g.running:
+            g.new()
+            if args.record and g.last_replay is not None:
+                g.last_replay.save(args.record)
+            if g.running:  # Verifica se não saiu durante o jogo
+                g.show_game_over()
+
+        g.close()
+        if args.profile:
+            g.profiler.export(args.profile)
+            p = g.profiler.percentiles()
+            print(f"Profiler: {g.profiler.frames} quadros, p50 {p['p50']:.2f} ms, p95 {p['p95']:.2f} ms, p99 {p['p99']:.2f} ms")
@@ -0,0 +1,149 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele o jogo usa o backend "python"
+    np = None
+
+from settings import SCREEN_WIDTH
+
+# Tipos de movimento
+KIND_PLATFORM = 0  # MovingPlatform: inverte vx ao tocar qualquer borda
+KIND_ENEMY = 1  # FlyingEnemy: vx aponta para dentro da tela + flutuação vertical aleatória
+
+
+def available() -> bool:
+    return np is not None
+
+
+class MoverArrays:
+    """Backend vetorizado para plataformas móveis e inimigos voadores.
+
+    Posições, velocidades e tamanhos ficam em arrays NumPy contíguos (um
+    elemento por sprite, sem buracos: remover troca com o último). step()
+    avança todos de uma vez, com as mesmas regras de MovingPlatform.update e
+    FlyingEnemy.update, e copia a posição de volta para x/y/rect/hitbox de
+    cada sprite, então o desenho e as colisões continuam iguais.
+
+    A inversão vertical aleatória usa um gerador NumPy próprio, então uma
+    partida com este backend não é igual à mesma semente no backend "python".
+    """
+
+    def __init__(self, seed: int, capacity: int = 64, bucket_height: int = 100) -> None:
+        if np is None:
+            raise RuntimeError("backend numpy indisponível: instale o pacote numpy")
+        self.rng = np.random.default_rng(seed)
+        self.bucket_height = bucket_height
+        self.count = 0
+        self.sprites = []
+        self._alloc(capacity)
+        # Sprites que mudaram de faixa do índice vertical no último step()
+        self.rebucketed = []
+
+    def _alloc(self, capacity: int) -> None:
+        old = self.count
+        arrays = {}
+        for name in ("x", "y", "vx", "vy"):
+            arrays[name] = np.zeros(capacity, dtype=np.float64)
+        for name in ("w", "h", "kind", "bucket_top", "bucket_bottom"):
+            arrays[name] = np.zeros(capacity, dtype=np.int64)
+        if old:
+            for name, array in arrays.items():
+                array[:old] = getattr(self, name)[:old]
+        for name, array in arrays.items():
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def add(self, sprite, kind: int) -> None:
+        if self.count == self.capacity:
+            self._alloc(self.capacity * 2)
+        i = self.count
+        self.x[i] = sprite.x
+        self.y[i] = sprite.y
+        self.vx[i] = sprite.vx
+        self.vy[i] = getattr(sprite, "vy", 0.0)
+        self.w[i] = sprite.rect.width
+        self.h[i] = sprite.rect.height
+        self.kind[i] = kind
+        self.bucket_top[i] = sprite.rect.top // self.bucket_height
+        self.bucket_bottom[i] = (sprite.rect.bottom - 1) // self.bucket_height
+        self.sprites.append(sprite)
+        sprite.movers = self
+        sprite.mover_slot = i
+        self.count += 1
+
+    def remove(self, sprite) -> None:
+        i = sprite.mover_slot
+        last = self.count - 1
+        if i != last:
+            # Mantém os arrays densos: o último ocupa a vaga
+            for name in ("x", "y", "vx", "vy", "w", "h", "kind", "bucket_top", "bucket_bottom"):
+                array = getattr(self, name)
+                array[i] = array[last]
+            moved = self.sprites[last]
+            self.sprites[i] = moved
+            moved.mover_slot = i
+        self.sprites.pop()
+        self.count -= 1
+        sprite.movers = None
+        sprite.mover_slot = None
+
+    def step(self) -> None:
+        n = self.count
+        self.rebucketed = []
+        if n == 0:
+            return
+        x, y, vx, vy = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n]
+        w, h, kind = self.w[:n], self.h[:n], self.kind[:n]
+        enemy = kind == KIND_ENEMY
+
+        prev_x = x.copy()
+        prev_y = y.copy()
+        x += vx
+        y += vy  # vy das plataformas é sempre 0
+
+        # Bordas, avaliadas sobre a posição inteira do rect (como no sprite)
+        left = np.round(x)
+        right = left + w
+        hit_right = right > SCREEN_WIDTH
+        hit_left = left < 0
+        platform_flip = ~enemy & (hit_right | hit_left)
+        vx[platform_flip] *= -1
+        speed = np.abs(vx)
+        vx[:] = np.where(enemy & hit_right, -speed, np.where(enemy & ~hit_right & hit_left, speed, vx))
+
+        # Inversão aleatória da flutuação vertical dos inimigos (2% por passo)
+        vy[enemy & (self.rng.random(n) < 0.02)] *= -1
+
+        # Faixas do índice vertical (ver BucketGroup) que mudaram
+        top = np.round(y).astype(np.int64)
+        bucket_top = top // self.bucket_height
+        bucket_bottom = (top + h - 1) // self.bucket_height
+        changed = np.nonzero((bucket_top != self.bucket_top[:n]) | (bucket_bottom != self.bucket_bottom[:n]))[0]
+        self.bucket_top[:n] = bucket_top
+        self.bucket_bottom[:n] = bucket_bottom
+
+        # Hitbox (75% do rect) centralizado como em FlyingEnemy: rect.center -> hitbox.center
+        rx = left.astype(np.int64)
+        hx = rx + w // 2 - (w * 3 // 4) // 2
+        hy = top + h // 2 - (h * 3 // 4) // 2
+
+        # Copia as posições para os sprites (uma passada, sem chamadas de método)
+        sprites = self.sprites
+        for sprite, sx, sy, px, py, rxi, ryi, hxi, hyi in zip(
+                sprites, x.tolist(), y.tolist(), prev_x.tolist(), prev_y.tolist(),
+                rx.tolist(), top.tolist(), hx.tolist(), hy.tolist()):
+            sprite.prev_x = px
+            sprite.prev_y = py
+            sprite.x = sx
+            sprite.y = sy
+            sprite.rect.topleft = (rxi, ryi)
+            if sprite.hitbox is not None:
+                sprite.hitbox.topleft = (hxi, hyi)
+        self.rebucketed = [sprites[i] for i in changed.tolist()]
+
+    def flush(self) -> None:
+        """Copia as velocidades dos arrays de volta para os sprites"""
+        n = self.count
+        for sprite, svx, svy, kind in zip(self.sprites, self.vx[:n].tolist(), self.vy[:n].tolist(), self.kind[:n].tolist()):
+            sprite.vx = svx
+            if kind == KIND_ENEMY:
+                sprite.vy = svy
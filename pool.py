@@ -0,0 +1,63 @@
+class Pool:
+    """Guarda sprites mortos para reaproveitá-los em vez de criar objetos novos.
+
+    O objeto precisa ter reset(...) com a mesma assinatura do __init__ e um
+    atributo pool; Entity.kill() devolve o sprite ao pool automaticamente.
+    Cada acquire() dá ao objeto um entity_id novo (único dentro do pool),
+    então um sprite reaproveitado conta como outra entidade.
+    """
+
+    def __init__(self, factory, name: str = "") -> None:
+        self.factory = factory
+        self.name = name or getattr(factory, "__name__", "pool")
+        self.free = []
+        self.next_id = 0
+        # Estatísticas
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+
+    def acquire(self, *args, **kwargs):
+        """Retorna um objeto pronto para uso, reaproveitado se possível"""
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+        else:
+            obj = self.factory(*args, **kwargs)
+            obj.pool = self
+            self.created += 1
+        obj.in_pool = False
+        obj.entity_id = self.next_id
+        self.next_id += 1
+        return obj
+
+    def release(self, obj) -> None:
+        """Devolve o objeto ao pool (chamadas repetidas são ignoradas)"""
+        if obj.in_pool:
+            return
+        obj.in_pool = True
+        self.free.append(obj)
+        self.released += 1
+
+    def prewarm(self, count: int, *args, **kwargs) -> None:
+        """Cria objetos com antecedência para não alocar durante o jogo"""
+        while len(self.free) < count:
+            obj = self.factory(*args, **kwargs)
+            obj.pool = self
+            obj.in_pool = True
+            self.free.append(obj)
+            self.created += 1
+
+    @property
+    def in_use(self) -> int:
+        return self.created - len(self.free)
+
+    def stats(self) -> dict:
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "released": self.released,
+            "free": len(self.free),
+            "in_use": self.in_use,
+        }
@@ -0,0 +1,122 @@
+import csv
+import json
+from collections import deque
+from time import perf_counter_ns
+import pygame
+
+# Fases medidas em cada quadro (na ordem em que acontecem)
+PHASES = ("events", "sprites", "collisions", "level", "broadcast", "snapshot", "draw")
+
+
+class FrameProfiler:
+    """Tempo de cada fase do quadro (perf_counter_ns) e contagem de entidades.
+
+    Uso no loop: begin_frame(), lap(fase) ao fim de cada fase e
+    end_frame(contagens). Fases que rodam várias vezes no mesmo quadro (vários
+    passos de simulação) são somadas. Mantém uma janela deslizante para os
+    percentis e, se record=True, guarda uma linha por quadro para exportar.
+    """
+
+    def __init__(self, window: int = 600, record: bool = False) -> None:
+        self.window = deque(maxlen=window)  # Duração total dos últimos quadros (ns)
+        self.phase_window = {phase: deque(maxlen=window) for phase in PHASES}
+        self.record = record
+        self.rows = []
+        self.frames = 0
+        self.current = dict.fromkeys(PHASES, 0)
+        self.steps = 0
+        self.counts = {}
+        self.start = self.last = perf_counter_ns()
+
+    def begin_frame(self) -> None:
+        self.start = self.last = perf_counter_ns()
+        for phase in PHASES:
+            self.current[phase] = 0
+        self.steps = 0
+
+    def lap(self, phase: str) -> None:
+        """Soma à fase o tempo desde o último lap()/begin_frame()"""
+        now = perf_counter_ns()
+        self.current[phase] += now - self.last
+        self.last = now
+
+    def end_frame(self, counts: dict) -> None:
+        total = perf_counter_ns() - self.start
+        self.window.append(total)
+        for phase in PHASES:
+            self.phase_window[phase].append(self.current[phase])
+        self.counts = counts
+        if self.record:
+            self.rows.append((self.frames, self.steps, total, *self.current.values(), counts))
+        self.frames += 1
+
+    def percentiles(self, values=None) -> dict:
+        """p50/p95/p99 em milissegundos (da janela deslizante)"""
+        values = sorted(self.window if values is None else values)
+        if not values:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+        last = len(values) - 1
+        return {name: values[min(last, int(q * len(values)))] / 1e6
+                for name, q in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))}
+
+    def phase_means(self) -> dict:
+        """Média de cada fase na janela, em milissegundos"""
+        return {phase: (sum(w) / len(w) / 1e6 if w else 0.0) for phase, w in self.phase_window.items()}
+
+    def _records(self) -> list:
+        records = []
+        for frame, steps, total, *rest in self.rows:
+            counts = rest.pop()
+            record = {"frame": frame, "steps": steps, "total_ms": round(total / 1e6, 4)}
+            for phase, ns in zip(PHASES, rest):
+                record[phase + "_ms"] = round(ns / 1e6, 4)
+            record.update(counts)
+            records.append(record)
+        return records
+
+    def export(self, path: str) -> None:
+        """Salva os quadros gravados em CSV ou JSON (pela extensão do arquivo)"""
+        records = self._records()
+        if path.endswith(".json"):
+            with open(path, "w") as f:
+                json.dump({"summary": self.percentiles(), "frames": records}, f)
+            return
+        fields = list(records[0]) if records else ["frame", "steps", "total_ms"] + [p + "_ms" for p in PHASES]
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(records)
+
+
+class ProfilerOverlay:
+    """Painel com os números do FrameProfiler (F3 liga/desliga).
+
+    O texto muda a cada quadro, então não passa pelo cache do TextRenderer:
+    o painel é montado numa superfície própria e só refeito a cada `refresh`
+    quadros.
+    """
+
+    def __init__(self, font: pygame.font.Font, refresh: int = 15) -> None:
+        self.font = font
+        self.refresh = refresh
+        self.surface = None
+        self.built_at = -refresh
+
+    def lines(self, profiler: FrameProfiler) -> list:
+        p = profiler.percentiles()
+        lines = [f"quadro p50 {p['p50']:.2f}  p95 {p['p95']:.2f}  p99 {p['p99']:.2f} ms"]
+        lines += [f"{phase:<10} {ms:6.3f} ms" for phase, ms in profiler.phase_means().items()]
+        lines += [f"{name:<10} {count}" for name, count in profiler.counts.items()]
+        return lines
+
+    def draw(self, screen: pygame.Surface, profiler: FrameProfiler, pos: tuple = (10, 40)) -> None:
+        if self.surface is None or profiler.frames - self.built_at >= self.refresh:
+            rendered = [self.font.render(line, True, (255, 255, 0)) for line in self.lines(profiler)]
+            height = self.font.get_linesize()
+            width = max(s.get_width() for s in rendered) + 8
+            self.surface = pygame.Surface((width, height * len(rendered) + 8), pygame.SRCALPHA)
+            self.surface.fill((0, 0, 0, 160))
+            for i, s in enumerate(rendered):
+                self.surface.blit(s, (4, 4 + i * height))
+            self.built_at = profiler.frames
+        screen.blit(self.surface, pos)
@@ -0,0 +1,159 @@
+import pygame
+
+
+class DirtyRenderer:
+    """Renderizador opcional que só envia à tela as regiões que mudaram.
+
+    Guarda a imagem e o retângulo de cada sprite no último quadro; a cada quadro
+    restaura o fundo onde algo mudou, redesenha só os sprites que tocam essas
+    regiões e chama pygame.display.update(rects). Quando a câmera rola a tela
+    inteira muda, então faz um redesenho completo com flip(). Com um atlas
+    (atlas.TextureAtlas) os sprites são recortados dele em vez de usar as
+    imagens soltas.
+    """
+
+    def __init__(self, screen: pygame.Surface, background: pygame.Surface, atlas=None) -> None:
+        self.screen = screen
+        self.background = background
+        self.atlas = atlas
+        self.last = {}  # sprite -> (imagem, retângulo) desenhados no último quadro
+        self.hud_rect = None
+        self.hud_value = None
+        self.needs_full = True
+        # Estatísticas para comparar com o modo de tela cheia
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.pixels_pushed = 0
+
+    def invalidate(self) -> None:
+        """Força um redesenho completo no próximo quadro"""
+        self.needs_full = True
+
+    def draw(self, entries: list, hud, score: int, hud_pos: tuple, scrolled: bool) -> None:
+        """Desenha um quadro.
+
+        entries: lista de (chave, imagem, retângulo na tela) na ordem de desenho.
+        hud: objeto com measure()/draw() (ScoreHUD) desenhado por cima de tudo.
+        scrolled: True se a câmera se moveu neste quadro.
+        """
+        if self.needs_full or scrolled:
+            self._draw_full(entries, hud, score, hud_pos)
+            return
+
+        current = {key: (image, rect) for key, image, rect in entries}
+        dirty = []
+        # Sprites que sumiram ou mudaram de imagem/posição
+        for key, (image, rect) in self.last.items():
+            now = current.get(key)
+            if now is None or now[0] is not image or now[1] != rect:
+                dirty.append(rect)
+        for key, (image, rect) in current.items():
+            before = self.last.get(key)
+            if before is None or before[0] is not image or before[1] != rect:
+                dirty.append(rect)
+
+        # A HUD é redesenhada se o valor mudou ou se algo passou por baixo dela
+        hud_rect = hud.measure(score, hud_pos)
+        if score != self.hud_value or (dirty and hud_rect.collidelist(dirty) != -1):
+            dirty.append(self.hud_rect)
+            dirty.append(hud_rect)
+
+        # Recorta à tela (sprites recém-criados nascem acima da área visível)
+        screen_rect = self.screen.get_rect()
+        dirty = [r.clip(screen_rect) for r in dirty if r is not None]
+        dirty = [r for r in dirty if r.width and r.height]
+
+        if dirty:
+            atlas = self.atlas
+            # Cada região é recomposta por inteiro (fundo + sprites + HUD) com
+            # clip, para não desenhar duas vezes por cima das bordas com alpha
+            for dirty_rect in dirty:
+                self.screen.set_clip(dirty_rect)
+                self.screen.blit(self.background, dirty_rect, dirty_rect)
+                for key, image, rect in entries:
+                    if rect.colliderect(dirty_rect):
+                        if atlas is None:
+                            self.screen.blit(image, rect)
+                        else:
+                            self.screen.blit(atlas.surface, rect, atlas.areas[image])
+                if hud_rect.colliderect(dirty_rect):
+                    hud.draw(self.screen, score, hud_pos)
+            self.screen.set_clip(None)
+            pygame.display.update(dirty)
+            self.pixels_pushed += sum(r.width * r.height for r in dirty)
+
+        self.last = {key: (image, rect.copy()) for key, (image, rect) in current.items()}
+        self.hud_rect = hud_rect
+        self.hud_value = score
+        self.partial_frames += 1
+
+    def _draw_full(self, entries: list, hud, score: int, hud_pos: tuple) -> None:
+        self.screen.blit(self.background, (0, 0))
+        if self.atlas is None:
+            self.screen.blits([(image, rect) for _, image, rect in entries], doreturn=False)
+        else:
+            source, areas = self.atlas.surface, self.atlas.areas
+            self.screen.blits([(source, rect, areas[image]) for _, image, rect in entries],
+                              doreturn=False)
+        self.hud_rect = hud.draw(self.screen, score, hud_pos)
+        self.hud_value = score
+        pygame.display.flip()
+        self.last = {key: (image, rect.copy()) for key, image, rect in entries}
+        self.needs_full = False
+        self.full_frames += 1
+        self.pixels_pushed += self.screen.get_width() * self.screen.get_height()
+
+
+class AdaptiveQuality:
+    """Ajusta a qualidade para o quadro caber no orçamento de tempo.
+
+    record() recebe o trabalho de cada quadro em ms (eventos, simulação e
+    desenho, sem a espera do clock). A cada `window` quadros compara a média
+    com o orçamento: acima de `high` desce um nível, abaixo de `low` sobe um.
+    Níveis: 0 completo; 1 sem efeitos opcionais (interpolação entre passos);
+    2 e 3 também só apresentam um quadro a cada 2 ou 3. Janelas grandes
+    custam mais para escalar e apresentar, então é aí que o ajuste atua.
+    """
+    # (interpolação, apresenta 1 quadro a cada N)
+    LEVELS = ((True, 1), (False, 1), (False, 2), (False, 3))
+
+    def __init__(self, budget_ms: float, window: int = 30, high: float = 0.9, low: float = 0.5,
+                 enabled: bool = True) -> None:
+        self.budget_ms = budget_ms
+        self.window = window
+        self.high = high
+        self.low = low
+        self.enabled = enabled
+        self.level = 0
+        self.samples = []
+        self.frame = 0
+        # Estatísticas
+        self.skipped = 0
+        self.changes = 0
+
+    @property
+    def interpolate(self) -> bool:
+        return self.LEVELS[self.level][0]
+
+    def should_present(self) -> bool:
+        """True se este quadro deve ser desenhado e apresentado"""
+        self.frame += 1
+        if self.frame % self.LEVELS[self.level][1] == 0:
+            return True
+        self.skipped += 1
+        return False
+
+    def record(self, work_ms: float) -> None:
+        if not self.enabled:
+            return
+        self.samples.append(work_ms)
+        if len(self.samples) < self.window:
+            return
+        mean = sum(self.samples) / len(self.samples)
+        self.samples.clear()
+        if mean > self.budget_ms * self.high and self.level < len(self.LEVELS) - 1:
+            self.level += 1
+            self.changes += 1
+        elif mean < self.budget_ms * self.low and self.level > 0:
+            self.level -= 1
+            self.changes += 1
@@ -0,0 +1,52 @@
+import struct
+
+# Cabeçalho: assinatura, versão, semente, número de quadros
+MAGIC = b"DJRP"
+VERSION = 1
+HEADER = struct.Struct("<4sBQI")
+BITS_PER_FRAME = 2  # INPUT_LEFT | INPUT_RIGHT
+FRAMES_PER_BYTE = 8 // BITS_PER_FRAME
+
+
+class Replay:
+    """Semente da partida + bits de controle de cada quadro.
+
+    Como a simulação só depende da semente e dos controles, reproduzir os
+    mesmos controles com a mesma semente recria a partida bit a bit.
+    """
+
+    def __init__(self, seed: int, inputs: bytes = b"") -> None:
+        self.seed = seed
+        self.inputs = bytearray(inputs)
+
+    def __len__(self) -> int:
+        return len(self.inputs)
+
+    def to_bytes(self) -> bytes:
+        """Formato compacto: 2 bits por quadro, 4 quadros por byte"""
+        packed = bytearray((len(self.inputs) + FRAMES_PER_BYTE - 1) // FRAMES_PER_BYTE)
+        for i, controls in enumerate(self.inputs):
+            packed[i // FRAMES_PER_BYTE] |= (controls & 0b11) << (BITS_PER_FRAME * (i % FRAMES_PER_BYTE))
+        return HEADER.pack(MAGIC, VERSION, self.seed, len(self.inputs)) + bytes(packed)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        magic, version, seed, frames = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("arquivo de replay inválido ou de outra versão")
+        packed = data[HEADER.size:]
+        if len(packed) * FRAMES_PER_BYTE < frames:
+            raise ValueError("arquivo de replay truncado")
+        inputs = bytearray(frames)
+        for i in range(frames):
+            inputs[i] = (packed[i // FRAMES_PER_BYTE] >> (BITS_PER_FRAME * (i % FRAMES_PER_BYTE))) & 0b11
+        return cls(seed, inputs)
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
@@ -0,0 +1,137 @@
+import queue
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    played_at REAL NOT NULL,
+    seed INTEGER,
+    score INTEGER NOT NULL,
+    frames INTEGER NOT NULL,
+    cause TEXT,
+    difficulty INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_score ON runs (score DESC);
+"""
+
+_STOP = object()
+
+
+class ScoreStore:
+    """Placar local em SQLite (modo WAL) que nunca bloqueia o loop do jogo.
+
+    A conexão pertence a uma thread de escrita: record() só atualiza o cache
+    em memória (top-N e totais) e põe a partida numa fila; a thread grava em
+    lotes, uma transação por lote. top() e stats() leem só o cache, então a
+    tela de game over mostra o placar na hora. Se o banco não puder ser
+    aberto, o placar continua funcionando só em memória.
+    """
+
+    def __init__(self, path: str, top_n: int = 5, batch_window: float = 0.5) -> None:
+        self.path = path
+        self.top_n = top_n
+        self.batch_window = batch_window  # Espera por mais partidas antes de gravar
+        self.lock = threading.Lock()
+        self.cache = []  # [(score, played_at, seed, cause)] em ordem decrescente
+        self.runs = 0
+        self.best = 0
+        self.queue = queue.SimpleQueue()
+        self.ready = threading.Event()  # Cache carregado do disco
+        self.error = None
+        # Estatísticas da thread de escrita
+        self.batches = 0
+        self.written = 0
+        self.thread = threading.Thread(target=self._writer, name="score-writer", daemon=True)
+        self.thread.start()
+
+    def record(self, score: int, frames: int, seed: int = None, cause: str = None, difficulty: int = 0) -> int:
+        """Registra uma partida sem tocar no disco; retorna a posição no top-N (1..N) ou None"""
+        row = (time.time(), seed, score, frames, cause, difficulty)
+        entry = (score, row[0], seed, cause)
+        with self.lock:
+            self.runs += 1
+            self.best = max(self.best, score)
+            self._merge([entry])
+            rank = self.cache.index(entry) + 1 if entry in self.cache else None
+        self.queue.put(row)
+        return rank
+
+    def top(self) -> list:
+        """Melhores partidas (cópia do cache): [(score, played_at, seed, cause)]"""
+        with self.lock:
+            return list(self.cache)
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {"runs": self.runs, "best": self.best, "batches": self.batches, "written": self.written}
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Grava o que falta na fila e encerra a thread"""
+        self.queue.put(_STOP)
+        self.thread.join(timeout)
+
+    def _merge(self, entries: list) -> None:
+        self.cache = sorted(self.cache + entries, key=lambda e: (-e[0], e[1]))[:self.top_n]
+
+    def _open(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self.path)
+        db.execute("PRAGMA journal_mode=WAL")
+        # Em WAL, NORMAL só sincroniza no checkpoint: commits rápidos e banco consistente
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.executescript(SCHEMA)
+        rows = db.execute("SELECT score, played_at, seed, cause FROM runs ORDER BY score DESC, played_at LIMIT ?",
+                          (self.top_n,)).fetchall()
+        runs, best = db.execute("SELECT COUNT(*), COALESCE(MAX(score), 0) FROM runs").fetchone()
+        with self.lock:
+            # Partidas registradas antes do carregamento já estão no cache
+            self._merge([tuple(r) for r in rows])
+            self.runs += runs
+            self.best = max(self.best, best)
+        return db
+
+    def _writer(self) -> None:
+        db = None
+        try:
+            db = self._open()
+        except sqlite3.Error as error:
+            self.error = error
+            print(f"Aviso: placar não será salvo ({error})")
+        self.ready.set()
+
+        while True:
+            item = self.queue.get()
+            batch = []
+            stop = item is _STOP
+            if not stop:
+                batch.append(item)
+                # Junta o que chegar logo em seguida numa transação só
+                deadline = time.monotonic() + self.batch_window
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = self.queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        stop = True
+                        break
+                    batch.append(item)
+            if batch and db is not None:
+                try:
+                    with db:
+                        db.executemany("INSERT INTO runs (played_at, seed, score, frames, cause, difficulty) "
+                                       "VALUES (?, ?, ?, ?, ?, ?)", batch)
+                    with self.lock:
+                        self.batches += 1
+                        self.written += len(batch)
+                except sqlite3.Error as error:
+                    self.error = error
+                    print(f"Aviso: falha ao salvar o placar ({error})")
+            if stop:
+                break
+        if db is not None:
+            db.close()
@@ -1,10 +1,81 @@
+import os
+
+# Pasta do jogo: os caminhos de arquivos partem dela, não do diretório atual
+# (o jogo e módulos como env.py podem ser usados de qualquer lugar)
+GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+
 # Constantes do jogo
 SCREEN_WIDTH = 400
 SCREEN_HEIGHT = 600
-FPS = 60
+FPS = 60  # Passos de simulação por segundo (a física é contada por passo)
+
+# Loop de passo fixo: a renderização roda em RENDER_FPS (0 = sem limite) e
+# desenha posições interpoladas entre os dois últimos passos de simulação
+RENDER_FPS = FPS
+MAX_STEPS_PER_FRAME = 5  # Limite de passos para "alcançar" o tempo real em máquinas lentas
+IDLE_WAIT_MS = 500  # Menus parados dormem até um evento (ou este tempo)
+REWIND_BUFFER_SECONDS = 5  # Snapshots guardados (um por passo) para voltar no tempo
+REWIND_SECONDS = 3  # Quanto BACKSPACE volta durante a partida
+SCORES_DB = os.path.join(GAME_DIR, "scores.db")  # Placar local (SQLite)
+LEADERBOARD_SIZE = 5  # Recordes mostrados no game over
+SPECTATOR_HOST = "127.0.0.1"  # Transmissão para espectadores/fantasmas (ver spectate.py)
+SPECTATOR_PORT = 50505
+SPECTATOR_MAX_BUFFER = 256 * 1024  # Bytes pendentes antes de um espectador lento pular quadros
+GHOST_ALPHA = 110  # Opacidade do jogador fantasma
+
+# Tela: o jogo desenha numa superfície lógica SCREEN_WIDTH x SCREEN_HEIGHT e o
+# SDL a escala para o tamanho da janela (pygame.SCALED; F11 = tela cheia)
+SCALED_DISPLAY = True
+# Qualidade adaptativa (ver render.AdaptiveQuality): se o trabalho por quadro
+# passa do orçamento de RENDER_FPS, desliga a interpolação e depois pula
+# apresentações; a simulação continua igual
+ADAPTIVE_QUALITY = True
 
 GRAVITY = 0.5
 
+# Modo de renderização: "full" (fundo inteiro + flip a cada quadro) ou
+# "dirty" (só as regiões que mudaram, bom para hardware fraco)
+RENDER_MODE = "full"
+
+# Desenha os sprites recortando de um único atlas convertido (ver atlas.py)
+# em vez de uma superfície por imagem
+SPRITE_ATLAS = True
+
+# Backend dos sprites móveis: "python" (um update() por sprite) ou "numpy"
+# (arrays contíguos atualizados de forma vetorizada, ver movers.py)
+ENTITY_BACKEND = "python"
+
+# Geração de nível (valores ajustáveis; ver tune_levels.py)
+PLATFORM_GAP_MIN = 50  # Distância vertical entre plataformas consecutivas
+PLATFORM_GAP_MAX = 70
+PLATFORM_DRIFT = 50  # Deslocamento horizontal máximo em relação à anterior
+SAFE_PLATFORMS = 3  # As primeiras plataformas são sempre normais
+# Os limites *_MAX_SCREEN_Y são alturas do mundo (y = 0 é o topo da primeira
+# tela), então só restringem a tela inicial, como antes
+MOVING_CHANCE = 0.15  # Limiar do sorteio para plataforma móvel...
+MOVING_MAX_SCREEN_Y = 400  # ...só acima desta altura
+BREAKING_CHANCE = 0.30  # Limiar (acumulado) para plataforma quebrável
+BREAKING_MAX_SCREEN_Y = 300
+POWERUP_CHANCE = 0.1
+POWERUP_MAX_SCREEN_Y = 200
+SPRING_CHANCE = 0.7  # Senão é jetpack
+DIFFICULTY_STEP = 1000  # Altura escalada por nível de dificuldade
+ENEMY_BASE_CHANCE = 0.01  # Chance de inimigo por passo de rolagem
+ENEMY_CHANCE_PER_LEVEL = 0.005
+ENEMY_MAX_EXTRA_CHANCE = 0.05
+
+# Streaming do nível em chunks (ver chunks.py)
+CHUNK_HEIGHT = 600  # Altura de cada chunk no mundo
+CHUNK_LOOKAHEAD = 3  # Chunks mantidos prontos à frente da câmera
+CHUNK_THREAD = False  # Gerar os chunks numa thread separada
+
+# Canais do mixer reservados por grupo de sons (ver sounds.py)
+SOUND_GROUPS = {"player": 2, "world": 4, "ui": 2}
+
+# Bits de controle do jogador (um inteiro por quadro, ver Player.controls)
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+
 # Cores
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -13,9 +84,10 @@ BLUE = (100, 100, 255)
 RED = (255, 100, 100)
 
 # Caminhos dos assets
-IMG_DIR = "assets/img"
-SND_DIR = "assets/snd"
-FONT_DIR = "assets/font"
+IMG_DIR = os.path.join(GAME_DIR, "assets", "img")
+SND_DIR = os.path.join(GAME_DIR, "assets", "snd")
+FONT_DIR = os.path.join(GAME_DIR, "assets", "font")
+BAKED_ASSETS = os.path.join(GAME_DIR, "assets", "baked.bin")  # Imagens já redimensionadas (python bake.py); None desliga
 
 # Documentação dos assets:
 # Images:
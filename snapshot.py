@@ -0,0 +1,183 @@
+import pickle
+from array import array
+from collections import deque
+import movers
+from assets import assets
+from chunks import ChunkStreamer
+from settings import CHUNK_LOOKAHEAD, CHUNK_THREAD
+
+# Tipos de entidade gravados no snapshot (pool de origem)
+KINDS = ("normal", "moving", "breaking", "powerup", "enemy")
+KIND_CODES = {name: code for code, name in enumerate(KINDS)}
+POWERUP_TYPES = ("spring", "jetpack")
+FLOATS = 6  # x, y, prev_x, prev_y, vx, vy por entidade
+
+
+class Snapshot:
+    """Estado completo da simulação num quadro.
+
+    Os sprites do nível ficam em arrays contíguos (um código de tipo, seis
+    floats e um inteiro extra por entidade, na ordem de all_sprites), sem
+    referências a objetos do pygame; o resto são tuplas de números.
+    """
+    __slots__ = ("frame", "seed", "game", "player", "level", "camera", "chunks", "rng",
+                 "kinds", "floats", "extras", "mover_order", "mover_rng")
+
+    def to_bytes(self) -> bytes:
+        return pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> "Snapshot":
+        snapshot = pickle.loads(data)
+        if not isinstance(snapshot, Snapshot):
+            raise ValueError("não é um snapshot")
+        return snapshot
+
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+
+def capture(game) -> Snapshot:
+    """Copia o estado do jogo (sem alterar nada)"""
+    level = game.level
+    player = game.player
+    snap = Snapshot()
+    snap.frame = game.frame
+    snap.seed = game.seed
+    snap.game = (game.score, game.playing, game.death_cause)
+    snap.player = (player.x, player.y, player.prev_x, player.prev_y, player.vx, player.vy,
+                   player.is_jumping, player.controls, player.powered_up, player.was_powered_up)
+    snap.level = (level.max_score, level.total_height_climbed, level.displayed_score,
+                  level.platform_count, level.difficulty, level.scrolled)
+    snap.camera = (level.camera.y, level.camera.prev_y)
+    snap.chunks = (level.streamer.seed, level.streamer.next_index)
+    version, state, gauss = level.rng.getstate()
+    snap.rng = (version, array("I", state), gauss)
+
+    if level.movers is not None:
+        level.movers.flush()  # vx/vy atualizados ficam nos arrays
+    kind_of = {id(pool): KIND_CODES[name] for name, pool in level.pools.items()}
+    kinds = bytearray()
+    floats = array("d")
+    extras = array("i")
+    index = {}
+    for sprite in level.all_sprites:
+        if sprite is player:
+            continue
+        code = kind_of[id(sprite.pool)]
+        index[sprite] = len(kinds)
+        kinds.append(code)
+        floats.extend((sprite.x, sprite.y, sprite.prev_x, sprite.prev_y,
+                       getattr(sprite, "vx", 0.0), getattr(sprite, "vy", 0.0)))
+        if code == 2:
+            extras.append(sprite.break_time if sprite.breaking else -1)
+        elif code == 3:
+            extras.append(POWERUP_TYPES.index(sprite.type))
+        else:
+            extras.append(0)
+    snap.kinds = bytes(kinds)
+    snap.floats = floats
+    snap.extras = extras
+    if level.movers is not None:
+        # A ordem dos arrays decide quem recebe cada número aleatório
+        snap.mover_order = array("i", (index[s] for s in level.movers.sprites))
+        snap.mover_rng = level.movers.rng.bit_generator.state
+    else:
+        snap.mover_order = None
+        snap.mover_rng = None
+    return snap
+
+
+def restore(game, snap: Snapshot) -> None:
+    """Volta o jogo exatamente ao estado do snapshot, reaproveitando os pools"""
+    level = game.level
+    player = game.player
+    level.clear(player)  # Devolve os sprites atuais aos pools
+    level.streamer = ChunkStreamer(snap.chunks[0], CHUNK_LOOKAHEAD, CHUNK_THREAD, first=snap.chunks[1])
+    pools = level.pools
+    numpy_movers = level.movers is not None
+
+    created = []
+    for i, code in enumerate(snap.kinds):
+        x, y, prev_x, prev_y, vx, vy = snap.floats[i * FLOATS:(i + 1) * FLOATS]
+        extra = snap.extras[i]
+        if code == 0:
+            sprite = pools["normal"].acquire(0, 0)
+        elif code == 1:
+            sprite = pools["moving"].acquire(0, 0, vx=vx)
+        elif code == 2:
+            sprite = pools["breaking"].acquire(0, 0)
+            if extra >= 0:
+                sprite.breaking = True
+                sprite.break_time = extra
+                sprite.image = assets.image("platform_breaking_2")
+        elif code == 3:
+            sprite = pools["powerup"].acquire(0, 0, POWERUP_TYPES[extra])
+        else:
+            sprite = pools["enemy"].acquire(0, 0, level.rng)
+            sprite.vx = vx
+            sprite.vy = vy
+        sprite.x, sprite.y, sprite.prev_x, sprite.prev_y = x, y, prev_x, prev_y
+        sprite.sync_rect()
+        if sprite.hitbox is not None:
+            sprite.hitbox.center = sprite.rect.center
+
+        level.all_sprites.add(sprite)
+        if code <= 2:
+            level.platforms.add(sprite)
+        elif code == 3:
+            level.powerups.add(sprite)
+        else:
+            level.enemies.add(sprite)
+        if code == 2:
+            level.updating.add(sprite)
+        elif code in (1, 4) and not numpy_movers:
+            level.updating.add(sprite)
+        created.append(sprite)
+
+    if numpy_movers:
+        for i in snap.mover_order:
+            kind = movers.KIND_ENEMY if snap.kinds[i] == 4 else movers.KIND_PLATFORM
+            level.movers.add(created[i], kind)
+        level.movers.rng.bit_generator.state = snap.mover_rng
+
+    (player.x, player.y, player.prev_x, player.prev_y, player.vx, player.vy,
+     player.is_jumping, player.controls, player.powered_up, player.was_powered_up) = snap.player
+    player.sync_rect()
+    (level.max_score, level.total_height_climbed, level.displayed_score,
+     level.platform_count, level.difficulty, level.scrolled) = snap.level
+    level.camera.y, level.camera.prev_y = snap.camera
+    version, state, gauss = snap.rng
+    level.rng.setstate((version, tuple(state), gauss))
+    game.score, game.playing, game.death_cause = snap.game
+    game.frame = snap.frame
+    game.seed = snap.seed
+
+
+class SnapshotRing:
+    """Buffer circular com os snapshots mais recentes (para voltar no tempo)"""
+
+    def __init__(self, capacity: int) -> None:
+        self.snapshots = deque(maxlen=capacity)
+
+    def __len__(self) -> int:
+        return len(self.snapshots)
+
+    def push(self, snap: Snapshot) -> None:
+        self.snapshots.append(snap)
+
+    def clear(self) -> None:
+        self.snapshots.clear()
+
+    def rewind(self, frames: int) -> Snapshot:
+        """Snapshot de `frames` quadros atrás (ou o mais antigo), descartando os mais novos"""
+        if not self.snapshots:
+            return None
+        target = self.snapshots[-1].frame - frames
+        while len(self.snapshots) > 1 and self.snapshots[-1].frame > target:
+            self.snapshots.pop()
+        return self.snapshots[-1]
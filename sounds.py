@@ -0,0 +1,100 @@
+import pygame
+from assets import assets, SilentSound
+from settings import SOUND_GROUPS
+
+# Regras de cada som: chave -> (grupo, prioridade, intervalo mínimo em ms, vozes máximas)
+RULES = {
+    "jump": ("player", 1, 60, 1),
+    "platform_break": ("world", 1, 40, 2),
+    "powerup_pickup": ("world", 2, 0, 1),
+    "game_over": ("ui", 3, 0, 1),
+    "menu_hover": ("ui", 0, 80, 1),
+}
+
+
+class SoundBank:
+    """Central de sons do jogo: grupos de canais, limite de vozes e prioridades.
+
+    Cada grupo de SOUND_GROUPS tem canais reservados do mixer. play(chave)
+    respeita o intervalo mínimo do som (rajadas viram um só disparo), reinicia
+    a voz mais antiga quando o som já está no máximo de vozes e, com o grupo
+    cheio, só rouba um canal de um som de prioridade menor ou igual; senão o
+    som é descartado. Com enabled=False (headless) play() não faz nada.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled and bool(pygame.mixer.get_init())
+        self.groups = {}  # grupo -> lista de canais
+        self.playing = {}  # canal -> (chave, prioridade, início em ms)
+        self.last_played = {}  # chave -> último disparo em ms
+        # Estatísticas
+        self.played = 0
+        self.dropped = 0
+        self.stolen = 0
+        if not self.enabled:
+            return
+        total = sum(SOUND_GROUPS.values())
+        if pygame.mixer.get_num_channels() < total:
+            pygame.mixer.set_num_channels(total)
+        # Reservados: Sound.play() sem canal não usa os canais dos grupos
+        pygame.mixer.set_reserved(total)
+        index = 0
+        for group, count in SOUND_GROUPS.items():
+            self.groups[group] = [pygame.mixer.Channel(index + i) for i in range(count)]
+            index += count
+        # Buffers carregados uma vez pelo registro de assets
+        self.sounds = {key: assets.sound(key) for key in RULES}
+
+    def play(self, key: str) -> bool:
+        """Toca o som se as regras permitirem; retorna False se foi descartado"""
+        if not self.enabled:
+            return False
+        sound = self.sounds[key]
+        if isinstance(sound, SilentSound):  # Arquivo opcional ausente
+            return False
+        group, priority, cooldown, max_voices = RULES[key]
+        now = pygame.time.get_ticks()
+        last = self.last_played.get(key)
+        if last is not None and now - last < cooldown:
+            self.dropped += 1
+            return False
+
+        channels = self.groups[group]
+        voices = []  # Canais tocando este mesmo som
+        free = None
+        for channel in channels:
+            if not channel.get_busy():
+                self.playing.pop(channel, None)
+                if free is None:
+                    free = channel
+            elif self.playing.get(channel, (None,))[0] == key:
+                voices.append(channel)
+
+        if len(voices) >= max_voices:
+            # Reinicia a voz mais antiga em vez de somar outra
+            channel = min(voices, key=lambda c: self.playing[c][2])
+        elif free is not None:
+            channel = free
+        else:
+            # Grupo cheio: rouba o canal de menor prioridade (o mais antigo no empate)
+            victims = [c for c in channels if self.playing.get(c, (None, -1))[1] <= priority]
+            if not victims:
+                self.dropped += 1
+                return False
+            channel = min(victims, key=lambda c: self.playing.get(c, (None, -1, 0))[1:])
+            self.stolen += 1
+
+        channel.play(sound)
+        self.playing[channel] = (key, priority, now)
+        self.last_played[key] = now
+        self.played += 1
+        return True
+
+    def stop(self) -> None:
+        for channels in self.groups.values():
+            for channel in channels:
+                channel.stop()
+        self.playing.clear()
+
+    def stats(self) -> dict:
+        return {"played": self.played, "dropped": self.dropped, "stolen": self.stolen}
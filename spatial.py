@@ -0,0 +1,90 @@
+import pygame
+
+
+class BucketGroup(pygame.sprite.Group):
+    """Grupo de sprites com índice vertical por faixas (buckets) de altura fixa.
+
+    Cada sprite fica registrado nas faixas que seu rect cobre. Consultas de
+    colisão só olham as faixas próximas do retângulo pedido, em vez do grupo
+    inteiro. O índice é mantido ao adicionar/remover (inclusive via kill());
+    sprites que se movem na vertical precisam de relocate()/refresh().
+    """
+
+    def __init__(self, *sprites, bucket_height: int = 100) -> None:
+        self.bucket_height = bucket_height
+        self.buckets = {}  # índice da faixa -> {sprite: None}
+        self.ranges = {}  # sprite -> (primeira faixa, última faixa)
+        self.order = {}  # sprite -> ordem de inserção (mantém a ordem do Group)
+        self.counter = 0
+        super().__init__(*sprites)
+
+    def _range(self, rect: pygame.Rect) -> tuple:
+        h = self.bucket_height
+        return rect.top // h, (rect.bottom - 1) // h
+
+    def add_internal(self, sprite, layer=None) -> None:
+        super().add_internal(sprite)
+        self.order[sprite] = self.counter
+        self.counter += 1
+        self._insert(sprite, self._range(sprite.rect))
+
+    def remove_internal(self, sprite) -> None:
+        super().remove_internal(sprite)
+        self._remove(sprite)
+        del self.order[sprite]
+
+    def _insert(self, sprite, bucket_range: tuple) -> None:
+        self.ranges[sprite] = bucket_range
+        for i in range(bucket_range[0], bucket_range[1] + 1):
+            self.buckets.setdefault(i, {})[sprite] = None
+
+    def _remove(self, sprite) -> None:
+        first, last = self.ranges.pop(sprite)
+        for i in range(first, last + 1):
+            bucket = self.buckets[i]
+            del bucket[sprite]
+            if not bucket:
+                del self.buckets[i]
+
+    def relocate(self, sprite) -> None:
+        """Atualiza o índice depois que o sprite se moveu"""
+        bucket_range = self._range(sprite.rect)
+        if bucket_range != self.ranges[sprite]:
+            self._remove(sprite)
+            self._insert(sprite, bucket_range)
+
+    def refresh(self) -> None:
+        """Atualiza o índice de todos os sprites do grupo (para grupos que se movem)"""
+        for sprite in self.sprites():
+            self.relocate(sprite)
+
+    def query(self, rect: pygame.Rect) -> list:
+        """Candidatos nas faixas que o retângulo cobre, na ordem de inserção"""
+        first, last = self._range(rect)
+        found = {}
+        for i in range(first, last + 1):
+            bucket = self.buckets.get(i)
+            if bucket:
+                found.update(bucket)
+        if len(found) < 2:
+            return list(found)
+        return sorted(found, key=self.order.__getitem__)
+
+    def collide(self, rect: pygame.Rect) -> list:
+        """Sprites cujo rect intersecta o retângulo (como spritecollide, sem varrer tudo)"""
+        return [s for s in self.query(rect) if rect.colliderect(s.rect)]
+
+    def sprites_below(self, y: float) -> list:
+        """Sprites registrados em faixas a partir da altura y (para remover o que saiu da tela)
+
+        Na ordem de inserção, como query(): a ordem das faixas no dicionário
+        depende do histórico, e quem morre primeiro decide a ordem dos pools.
+        """
+        first = int(y // self.bucket_height)
+        found = {}
+        for i, bucket in self.buckets.items():
+            if i >= first:
+                found.update(bucket)
+        if len(found) < 2:
+            return list(found)
+        return sorted(found, key=self.order.__getitem__)
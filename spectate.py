@@ -0,0 +1,500 @@
+"""Transmissão local de partidas para espectadores e fantasmas.
+
+SpectatorServer (asyncio, numa thread) aceita conexões TCP em localhost e a
+cada passo publicado com publish(game) envia o quadro como diferença do
+anterior:
+
+  - pontuação, dificuldade, posição do jogador, câmera e fim da partida,
+    só o que mudou;
+  - entidades que nasceram (id, imagem, posição), sumiram (id), se
+    moveram (id, deslocamento) ou trocaram de imagem.
+
+O quadro é codificado uma vez só e os mesmos bytes vão para todos os
+espectadores, então a banda por espectador e o custo de codificar não
+crescem com o público. Quem conecta no meio (ou fica para trás) recebe um
+quadro completo (keyframe) e segue com as diferenças. Os ids das entidades
+vêm dos pools (Pool.acquire) e as imagens são índices de atlas.ATLAS_KEYS.
+
+GhostClient conecta num servidor e mantém o estado decodificado; o Game
+desenha o jogador dele como um fantasma.
+
+Rodado direto, transmite uma partida headless (bot de tune_levels.py) para
+N espectadores e mede bytes por quadro por espectador e o custo do
+servidor por quadro.
+
+Exemplos:
+
+    python main.py --serve                  # transmite as partidas
+    python main.py --ghost                  # noutro terminal: corre contra o fantasma
+    python main.py --ghost 127.0.0.1:50505
+    python spectate.py --clients 1 8 32 --frames 3000
+"""
+import argparse
+import asyncio
+import socket
+import struct
+import threading
+import time
+
+import pygame
+from assets import assets
+from atlas import ATLAS_KEYS
+from snapshot import KIND_CODES
+from settings import SPECTATOR_HOST, SPECTATOR_PORT, SPECTATOR_MAX_BUFFER, GHOST_ALPHA
+
+# Cada mensagem: tamanho (u32) + corpo; o corpo começa com tipo e quadro
+LENGTH = struct.Struct("<I")
+HEADER = struct.Struct("<BI")
+# Keyframe: semente, pontuação, dificuldade, jogador x/y, câmera, fim, nº de entidades
+KEY_STATE = struct.Struct("<QiiiiiBH")
+# Diferença: flags, campos marcados nelas e as quatro listas de entidades
+FLAGS = struct.Struct("<B")
+COUNTS = struct.Struct("<HHHH")  # nasceram, sumiram, moveram, trocaram de imagem
+SPAWN = struct.Struct("<IBii")  # id, imagem, x, y
+DESPAWN = struct.Struct("<I")
+MOVE = struct.Struct("<Ihh")  # id, dx, dy
+IMAGE = struct.Struct("<IB")
+INT = struct.Struct("<i")
+PAIR = struct.Struct("<hh")
+SHORT = struct.Struct("<h")
+BYTE = struct.Struct("<B")
+
+KEYFRAME = 1
+DELTA = 2
+# Flags da diferença
+SCORE = 1
+DIFFICULTY = 2
+PLAYER = 4
+CAMERA = 8
+END = 16
+
+CAUSES = (None, "fell", "enemy")
+NO_IMAGE = 255  # Imagem fora do atlas
+
+
+def ghost_image(image: pygame.Surface) -> pygame.Surface:
+    """Cópia semitransparente da imagem (alpha por pixel multiplicado por GHOST_ALPHA)"""
+    ghost = image.copy()
+    ghost.fill((255, 255, 255, GHOST_ALPHA), special_flags=pygame.BLEND_RGBA_MULT)
+    return ghost
+
+
+class StateEncoder:
+    """Guarda o último quadro codificado e gera as diferenças e os keyframes"""
+
+    def __init__(self) -> None:
+        self.seed = None
+        self.frame = None
+        self.state = None  # (pontuação, dificuldade, x, y, câmera, fim)
+        self.entities = {}  # id -> (imagem, x, y)
+        self.images = None  # superfície -> índice em ATLAS_KEYS
+
+    def capture(self, game) -> tuple:
+        """(estado, entidades) do quadro atual, em posições inteiras do mundo"""
+        if self.images is None:
+            self.images = {assets.image(key): code for code, key in enumerate(ATLAS_KEYS)}
+        images = self.images
+        level = game.level
+        player = game.player
+        # O id na transmissão junta o id do pool (entity_id) e o tipo de entidade
+        kinds = {id(pool): KIND_CODES[name] for name, pool in level.pools.items()}
+        entities = {}
+        for sprite in level.all_sprites:
+            if sprite is not player:
+                rect = sprite.rect
+                eid = (sprite.entity_id << 3 | kinds[id(sprite.pool)]) & 0xFFFFFFFF
+                entities[eid] = (images.get(sprite.image, NO_IMAGE), rect.x, rect.y)
+        state = (game.score, level.difficulty, player.rect.x, player.rect.y, round(level.camera.y),
+                 CAUSES.index(game.death_cause))
+        return state, entities
+
+    def encode(self, game, keyframe: bool = False) -> tuple:
+        """Codifica o quadro atual e o guarda como referência.
+
+        Retorna (diferença, keyframe) já com o tamanho na frente; o keyframe
+        só é gerado se pedido. Se o quadro não continua o anterior (nova
+        partida, retry, rewind ou salto grande demais) a diferença é None e
+        todos precisam do keyframe.
+        """
+        state, entities = self.capture(game)
+        delta = None
+        if game.seed == self.seed and self.frame is not None and game.frame == self.frame + 1:
+            delta = self._delta(game.frame, state, entities)
+        key = None
+        if keyframe or delta is None:
+            key = self._keyframe(game.frame, game.seed, state, entities)
+        self.seed = game.seed
+        self.frame = game.frame
+        self.state = state
+        self.entities = entities
+        return delta, key
+
+    def _keyframe(self, frame: int, seed: int, state: tuple, entities: dict) -> bytes:
+        parts = [HEADER.pack(KEYFRAME, frame), KEY_STATE.pack(seed, *state, len(entities))]
+        parts.extend(SPAWN.pack(eid, *entity) for eid, entity in entities.items())
+        body = b"".join(parts)
+        return LENGTH.pack(len(body)) + body
+
+    def _delta(self, frame: int, state: tuple, entities: dict) -> bytes:
+        old = self.state
+        previous = self.entities
+        flags = 0
+        fields = []
+        spawns = []
+        moves = []
+        images = []
+        try:
+            if state[0] != old[0]:
+                flags |= SCORE
+                fields.append(INT.pack(state[0]))
+            if state[1] != old[1]:
+                flags |= DIFFICULTY
+                fields.append(INT.pack(state[1]))
+            if state[2] != old[2] or state[3] != old[3]:
+                flags |= PLAYER
+                fields.append(PAIR.pack(state[2] - old[2], state[3] - old[3]))
+            if state[4] != old[4]:
+                flags |= CAMERA
+                fields.append(SHORT.pack(state[4] - old[4]))
+            if state[5] != old[5]:
+                flags |= END
+                fields.append(BYTE.pack(state[5]))
+            for eid, now in entities.items():
+                before = previous.get(eid)
+                if before is None:
+                    spawns.append(SPAWN.pack(eid, *now))
+                elif before != now:
+                    if before[1] != now[1] or before[2] != now[2]:
+                        moves.append(MOVE.pack(eid, now[1] - before[1], now[2] - before[2]))
+                    if before[0] != now[0]:
+                        images.append(IMAGE.pack(eid, now[0]))
+        except struct.error:
+            return None  # Deslocamento que não cabe em 16 bits: vai keyframe
+        despawns = [DESPAWN.pack(eid) for eid in previous if eid not in entities]
+        body = b"".join([HEADER.pack(DELTA, frame), FLAGS.pack(flags), *fields,
+                         COUNTS.pack(len(spawns), len(despawns), len(moves), len(images)),
+                         *spawns, *despawns, *moves, *images])
+        return LENGTH.pack(len(body)) + body
+
+
+class SpectatorState:
+    """Estado de uma partida transmitida, reconstruído a partir das mensagens"""
+
+    def __init__(self) -> None:
+        self.synced = False  # Já recebeu um keyframe
+        self.frame = 0
+        self.seed = None
+        self.score = 0
+        self.difficulty = 0
+        self.player = None  # (x, y) do jogador no mundo
+        self.camera_y = 0
+        self.cause = None  # "fell" ou "enemy" quando a partida termina
+        self.entities = {}  # id -> (imagem, x, y)
+
+    def apply(self, body: bytes) -> None:
+        """Aplica o corpo de uma mensagem (sem o tamanho)"""
+        kind, frame = HEADER.unpack_from(body)
+        offset = HEADER.size
+        if kind == KEYFRAME:
+            seed, score, difficulty, x, y, camera, cause, count = KEY_STATE.unpack_from(body, offset)
+            offset += KEY_STATE.size
+            end = offset + count * SPAWN.size
+            self.entities = {eid: (image, ex, ey) for eid, image, ex, ey in SPAWN.iter_unpack(body[offset:end])}
+            self.seed = seed
+            self.score = score
+            self.difficulty = difficulty
+            self.player = (x, y)
+            self.camera_y = camera
+            self.cause = CAUSES[cause]
+            self.frame = frame
+            self.synced = True
+            return
+        if kind != DELTA or not self.synced:
+            return
+
+        flags, = FLAGS.unpack_from(body, offset)
+        offset += FLAGS.size
+        if flags & SCORE:
+            self.score, = INT.unpack_from(body, offset)
+            offset += INT.size
+        if flags & DIFFICULTY:
+            self.difficulty, = INT.unpack_from(body, offset)
+            offset += INT.size
+        if flags & PLAYER:
+            dx, dy = PAIR.unpack_from(body, offset)
+            offset += PAIR.size
+            x, y = self.player
+            self.player = (x + dx, y + dy)
+        if flags & CAMERA:
+            dy, = SHORT.unpack_from(body, offset)
+            offset += SHORT.size
+            self.camera_y += dy
+        if flags & END:
+            cause, = BYTE.unpack_from(body, offset)
+            offset += BYTE.size
+            self.cause = CAUSES[cause]
+
+        spawns, despawns, moves, images = COUNTS.unpack_from(body, offset)
+        offset += COUNTS.size
+        entities = self.entities
+        end = offset + spawns * SPAWN.size
+        for eid, image, x, y in SPAWN.iter_unpack(body[offset:end]):
+            entities[eid] = (image, x, y)
+        offset, end = end, end + despawns * DESPAWN.size
+        for eid, in DESPAWN.iter_unpack(body[offset:end]):
+            entities.pop(eid, None)
+        offset, end = end, end + moves * MOVE.size
+        for eid, dx, dy in MOVE.iter_unpack(body[offset:end]):
+            image, x, y = entities[eid]
+            entities[eid] = (image, x + dx, y + dy)
+        offset, end = end, end + images * IMAGE.size
+        for eid, image in IMAGE.iter_unpack(body[offset:end]):
+            _, x, y = entities[eid]
+            entities[eid] = (image, x, y)
+        self.frame = frame
+
+
+class SpectatorServer:
+    """Servidor asyncio (numa thread própria) que transmite a partida.
+
+    publish() roda no loop do jogo: codifica o quadro uma vez e entrega os
+    bytes ao loop do servidor, que só os escreve em cada conexão. Um
+    espectador com mais de max_buffer bytes pendentes pula quadros e volta
+    com o próximo keyframe, sem atrasar os outros nem o jogo. Se a porta
+    não puder ser aberta, avisa e publish() não faz nada.
+    """
+
+    def __init__(self, host: str = SPECTATOR_HOST, port: int = SPECTATOR_PORT,
+                 max_buffer: int = SPECTATOR_MAX_BUFFER) -> None:
+        self.host = host
+        self.port = port
+        self.max_buffer = max_buffer
+        self.encoder = StateEncoder()
+        self.clients = {}  # writer -> precisa de keyframe
+        # Pedidos de keyframe (loop do servidor) e o último atendido (loop do jogo)
+        self.key_requests = 0
+        self.key_served = 0
+        self.server = None
+        # Estatísticas
+        self.frames = 0
+        self.keyframes = 0
+        self.bytes_encoded = 0
+        self.dropped = 0
+        self.encode_s = 0.0
+        self.broadcast_s = 0.0
+        self.loop = asyncio.new_event_loop()
+        self.ready = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="spectators", daemon=True)
+        self.thread.start()
+        self.ready.wait()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.server = self.loop.run_until_complete(
+                asyncio.start_server(self._serve, self.host, self.port))
+        except OSError as e:
+            print(f"Aviso: transmissão desligada, não abriu {self.host}:{self.port} ({e})")
+            self.ready.set()
+            self.loop.close()
+            return
+        self.port = self.server.sockets[0].getsockname()[1]  # Porta real se pediu a 0
+        self.ready.set()
+        self.loop.run_forever()
+        self.server.close()
+        for writer in self.clients:
+            writer.close()
+        self.loop.run_until_complete(self.server.wait_closed())
+        self.loop.close()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.clients[writer] = True
+        self.key_requests += 1
+        try:
+            while await reader.read(1024):
+                pass  # Os espectadores não mandam nada; só espera a conexão fechar
+        except ConnectionError:
+            pass
+        finally:
+            self.clients.pop(writer, None)
+            writer.close()
+
+    def publish(self, game) -> None:
+        """Envia o quadro atual de game a todos os espectadores"""
+        if self.server is None:
+            return
+        start = time.perf_counter()
+        requests = self.key_requests  # Lido antes de codificar: pedidos depois disso ficam para o próximo
+        delta, key = self.encoder.encode(game, requests != self.key_served)
+        if key is not None:
+            self.key_served = requests
+            self.keyframes += 1
+        self.frames += 1
+        self.bytes_encoded += len(delta if delta is not None else key)
+        self.encode_s += time.perf_counter() - start
+        self.loop.call_soon_threadsafe(self._broadcast, delta, key)
+
+    def _broadcast(self, delta: bytes, key: bytes) -> None:
+        start = time.perf_counter()
+        for writer, needs_key in list(self.clients.items()):
+            if writer.is_closing():
+                self.clients.pop(writer, None)
+                continue
+            if writer.transport.get_write_buffer_size() > self.max_buffer:
+                # Espectador lento: descarta diferenças até poder mandar um keyframe
+                if not needs_key:
+                    self.clients[writer] = True
+                    self.key_requests += 1
+                self.dropped += 1
+                continue
+            if needs_key or delta is None:
+                if key is None:
+                    continue  # O keyframe pedido sai no próximo quadro
+                writer.write(key)
+                self.clients[writer] = False
+            else:
+                writer.write(delta)
+        self.broadcast_s += time.perf_counter() - start
+
+    def stats(self) -> dict:
+        frames = max(1, self.frames)
+        return {
+            "clients": len(self.clients),
+            "frames": self.frames,
+            "keyframes": self.keyframes,
+            "bytes_per_frame": self.bytes_encoded / frames,
+            "dropped": self.dropped,
+            "encode_us": self.encode_s / frames * 1e6,
+            "broadcast_us": self.broadcast_s / frames * 1e6,
+        }
+
+    def close(self, timeout: float = 2.0) -> None:
+        if self.server is None:
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout)
+        self.server = None
+
+
+class GhostClient:
+    """Espectador leve: recebe a transmissão numa thread e mantém o estado.
+
+    O Game lê state.player para desenhar o fantasma. Se o servidor não
+    estiver no ar, só avisa e fica desconectado.
+    """
+
+    def __init__(self, host: str = SPECTATOR_HOST, port: int = SPECTATOR_PORT) -> None:
+        self.state = SpectatorState()
+        self.connected = False
+        self.thread = None
+        # Estatísticas
+        self.bytes_received = 0
+        self.messages = 0
+        try:
+            self.sock = socket.create_connection((host, port), timeout=2.0)
+        except OSError as e:
+            print(f"Aviso: sem transmissão em {host}:{port} ({e})")
+            self.sock = None
+            return
+        self.sock.settimeout(None)
+        self.connected = True
+        self.thread = threading.Thread(target=self._receive, name="ghost", daemon=True)
+        self.thread.start()
+
+    @property
+    def visible(self) -> bool:
+        """Há um jogador para desenhar (conectado, sincronizado e a partida não acabou)"""
+        state = self.state
+        return self.connected and state.synced and state.cause is None
+
+    def _receive(self) -> None:
+        buffer = bytearray()
+        try:
+            while True:
+                data = self.sock.recv(65536)
+                if not data:
+                    break
+                self.bytes_received += len(data)
+                buffer += data
+                offset = 0
+                while len(buffer) - offset >= LENGTH.size:
+                    size, = LENGTH.unpack_from(buffer, offset)
+                    end = offset + LENGTH.size + size
+                    if end > len(buffer):
+                        break  # Mensagem incompleta: espera o resto
+                    self.state.apply(bytes(buffer[offset + LENGTH.size:end]))
+                    self.messages += 1
+                    offset = end
+                del buffer[:offset]
+        except OSError:
+            pass
+        finally:
+            self.connected = False
+
+    def close(self) -> None:
+        if self.sock is None:
+            return
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+        self.thread.join(1.0)
+        self.sock = None
+
+
+def measure(clients: int, frames: int, fps: float, seed: int = 1) -> dict:
+    """Transmite `frames` passos de uma partida headless para `clients` espectadores"""
+    from game import Game
+    from tune_levels import bot_policy
+    game = Game(headless=True)
+    server = SpectatorServer(port=0)
+    viewers = [GhostClient(server.host, server.port) for _ in range(clients)]
+    deadline = time.perf_counter() + 2.0
+    while len(server.clients) < clients and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    game.spectators = server
+    game.reset(seed)
+    start = time.perf_counter()
+    for i in range(frames):
+        if not game.step(bot_policy(game)):
+            game.reset(seed + i + 1)
+        if fps:
+            delay = start + (i + 1) / fps - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+    time.sleep(0.3)  # Deixa os espectadores receberem o resto
+
+    # Todos terminam com o mesmo estado que o servidor codificou por último
+    encoder = server.encoder
+    synced = all(v.state.frame == encoder.frame and v.state.entities == encoder.entities
+                 and v.state.player == encoder.state[2:4] for v in viewers)
+    stats = server.stats()
+    received = sum(v.bytes_received for v in viewers) / max(1, clients)
+    for viewer in viewers:
+        viewer.close()
+    server.close()
+    return dict(stats, clients=clients, client_bytes_per_frame=received / frames, synced=synced)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Custo da transmissão para espectadores")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 4, 16, 32], help="números de espectadores")
+    parser.add_argument("--frames", type=int, default=3000, help="passos transmitidos por medida")
+    parser.add_argument("--fps", type=float, default=600, help="passos por segundo (0 = sem limite)")
+    args = parser.parse_args()
+
+    print(f"{'espect.':>7} {'B/quadro':>9} {'B/quadro cli':>12} {'keyframes':>9} {'pulados':>8} "
+          f"{'codif. us':>9} {'envio us':>9} {'sincron.':>8}")
+    for clients in args.clients:
+        m = measure(clients, args.frames, args.fps)
+        print(f"{m['clients']:>7} {m['bytes_per_frame']:>9.1f} {m['client_bytes_per_frame']:>12.1f} "
+              f"{m['keyframes']:>9} {m['dropped']:>8} {m['encode_us']:>9.1f} {m['broadcast_us']:>9.1f} "
+              f"{'sim' if m['synced'] else 'não':>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,58 +1,115 @@
 import pygame
-from settings import IMG_DIR, SND_DIR, GRAVITY, SCREEN_WIDTH, SCREEN_HEIGHT, WHITE
+from settings import GRAVITY, SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, INPUT_LEFT, INPUT_RIGHT
+from assets import assets
+from sounds import SoundBank
 import random
 
-class Player(pygame.sprite.Sprite):
+class Entity(pygame.sprite.Sprite):
+    """Sprite com posição float no mundo (canto superior esquerdo).
+
+    self.rect é só uma cópia inteira de (x, y) usada nas colisões; a tela é
+    calculada pela câmera na hora de desenhar.
+    """
+    pool = None  # Pool de origem (ver pool.py); None para sprites não reaproveitados
+    entity_id = None  # Dado pelo pool a cada acquire (identifica a entidade na transmissão)
+    movers = None  # Backend vetorizado que controla a posição (ver movers.py)
+    mover_slot = None
+    hitbox = None  # Só os inimigos têm hitbox próprio
+    
     def __init__(self) -> None:
         super().__init__()
-        # Carrega e redimensiona a imagem do jogador para 40x40
-        original_image = pygame.image.load(f"{IMG_DIR}/player.png").convert_alpha()
-        self.image = pygame.transform.scale(original_image, (40, 40))
-        self.rect = self.image.get_rect()
-        self.rect.midbottom = (200, 500)
+        self.x = 0.0
+        self.y = 0.0
+        # Posição no passo anterior, para desenhar interpolado (ver Camera.apply)
+        self.prev_x = 0.0
+        self.prev_y = 0.0
+        self.rect = None
+        self.in_pool = False
+
+    def place_at(self, anchor: str, pos: tuple) -> None:
+        """Posiciona o sprite pelo ponto de ancoragem (topleft, midbottom, center...)"""
+        if self.rect is None:
+            self.rect = self.image.get_rect()
+        else:
+            # Reaproveita o mesmo Rect ao reiniciar um sprite do pool
+            self.rect.size = self.image.get_size()
+        setattr(self.rect, anchor, pos)
+        self.x = self.prev_x = float(self.rect.x)
+        self.y = self.prev_y = float(self.rect.y)
+
+    def sync_rect(self) -> None:
+        self.rect.x = round(self.x)
+        self.rect.y = round(self.y)
+
+    def kill(self) -> None:
+        super().kill()
+        if self.movers is not None:
+            self.movers.remove(self)
+        # Sprites vindos de um pool voltam para ele ao morrer
+        if self.pool is not None:
+            self.pool.release(self)
+
+class Player(Entity):
+    def __init__(self, sounds: SoundBank = None) -> None:
+        super().__init__()
+        # Imagem do jogador (40x40) vem pré-carregada do registro de assets
+        self.image = assets.image("player")
+        self.place_at("midbottom", (200, 500))
         self.vx = 0
         self.vy = 0
         self.is_jumping = False
-        # Sons de pulo
-        self.jump_sound = pygame.mixer.Sound(f"{SND_DIR}/jump.wav")
-        self.jump_sound.set_volume(0.3)
+        # Bits de controle do quadro atual (INPUT_LEFT/INPUT_RIGHT), definidos pelo Game
+        self.controls = 0
+        # Central de sons do jogo (muda se não for passada, ex.: headless)
+        self.sounds = sounds if sounds is not None else SoundBank(enabled=False)
         # Novo estado para power-up
         self.powered_up = False
         self.was_powered_up = False
         
     def update(self) -> None:
+        self.prev_x, self.prev_y = self.x, self.y
         # Movimento horizontal baseado no input
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT]:
+        if self.controls & INPUT_LEFT:
             self.vx = -5
-        elif keys[pygame.K_RIGHT]:
+        elif self.controls & INPUT_RIGHT:
             self.vx = 5
         else:
             self.vx = 0
-        self.rect.x += self.vx
-        # Atualizar posição vertical
+        self.x += self.vx
+        # Atualizar posição vertical (float, sem perder a parte fracionária)
         self.vy += GRAVITY
-        self.rect.y += self.vy
-        # Corrigir atravessar as laterais
-        if self.rect.left > SCREEN_WIDTH:
-            self.rect.right = 0
-        if self.rect.right < 0:
-            self.rect.left = SCREEN_WIDTH
+        self.y += self.vy
+        # Corrigir atravessar as laterais (sem interpolar o "salto" de um lado ao outro)
+        if self.x > SCREEN_WIDTH:
+            self.x = self.prev_x = float(-self.rect.width)
+        if self.x + self.rect.width < 0:
+            self.x = self.prev_x = float(SCREEN_WIDTH)
+        self.sync_rect()
+    
+    def land(self, top: int) -> None:
+        """Apoia os pés do jogador na altura top (coordenadas do mundo)"""
+        self.y = float(top - self.rect.height)
+        self.sync_rect()
         
     def jump(self, boost: float = 1.0) -> None:
         # Define pulo, utilizando som ou power-up se desejar
         self.vy = -11 * boost  # Aumentado de -10 para -11 para garantir alcance
-        self.jump_sound.play()
+        self.sounds.play("jump")
         self.is_jumping = True
 
-class Platform(pygame.sprite.Sprite):
-    def __init__(self, x: int, y: int, image_name: str = "platform_green.png") -> None:
+class Platform(Entity):
+    def __init__(self, x: int, y: int, image_key: str = "platform_normal", **options) -> None:
         super().__init__()
-        # Carrega e redimensiona a imagem da plataforma para 70x20
-        original_image = pygame.image.load(f"{IMG_DIR}/{image_name}").convert_alpha()
-        self.image = pygame.transform.scale(original_image, (70, 20))
-        self.rect = self.image.get_rect(topleft=(x, y))
+        self.image_key = image_key
         self.type = "normal"
+        # options vão para o reset() da subclasse (ex.: vx e rng da MovingPlatform)
+        self.reset(x, y, **options)
+        
+    def reset(self, x: int, y: int) -> None:
+        """Deixa a plataforma como recém-criada na posição (x, y)"""
+        # Imagem da plataforma (70x20) compartilhada entre todas as instâncias
+        self.image = assets.image(self.image_key)
+        self.place_at("topleft", (x, y))
         
     def update(self) -> None:
         pass
@@ -66,25 +123,35 @@ class Platform(pygame.sprite.Sprite):
         return True
 
 class MovingPlatform(Platform):
-    def __init__(self, x: int, y: int) -> None:
-        super().__init__(x, y, "platform_blue_moving.png")
+    def __init__(self, x: int, y: int, rng: random.Random = random, vx: int = None) -> None:
+        # vx e rng vão direto para o reset(): com vx pronto (chunks) nada é sorteado
+        super().__init__(x, y, "platform_moving", rng=rng, vx=vx)
         self.type = "moving"
-        self.vx = random.choice([-2, 2])
+        
+    def reset(self, x: int, y: int, rng: random.Random = None, vx: int = None) -> None:
+        super().reset(x, y)
+        if rng is not None:
+            self.rng = rng
+        # vx pode vir pronto do chunk; senão é sorteado
+        self.vx = vx if vx is not None else self.rng.choice([-2, 2])
         
     def update(self) -> None:
-        self.rect.x += self.vx
+        self.prev_x = self.x
+        self.x += self.vx
+        self.sync_rect()
         # Inverter direção quando atingir os limites da tela
         if self.rect.right > SCREEN_WIDTH or self.rect.left < 0:
             self.vx *= -1
 
 class BreakingPlatform(Platform):
     def __init__(self, x: int, y: int) -> None:
-        super().__init__(x, y, "platform_brown_breaking_1.png")
+        super().__init__(x, y, "platform_breaking_1")
         self.type = "breaking"
+        
+    def reset(self, x: int, y: int) -> None:
+        super().reset(x, y)
         self.breaking = False
         self.break_time = 0
-        self.break_sound = pygame.mixer.Sound(f"{SND_DIR}/platform_break.wav")
-        self.break_sound.set_volume(0.4)
         
     def update(self) -> None:
         if self.breaking:
@@ -96,28 +163,24 @@ class BreakingPlatform(Platform):
         if not self.breaking:
             player.jump()
             self.breaking = True
-            self.break_sound.play()
+            player.sounds.play("platform_break")
             # Muda imagem para plataforma quebrada
-            original_image = pygame.image.load(f"{IMG_DIR}/platform_brown_breaking_2.png").convert_alpha()
-            self.image = pygame.transform.scale(original_image, (70, 20))
+            self.image = assets.image("platform_breaking_2")
         return True  # Mantém no grupo até que a atualização a remova
 
-class PowerUp(pygame.sprite.Sprite):
+class PowerUp(Entity):
     def __init__(self, x: int, y: int, type: str = "spring") -> None:
         super().__init__()
+        self.reset(x, y, type)
+        
+    def reset(self, x: int, y: int, type: str = "spring") -> None:
         self.type = type
-        if type == "spring":
-            original_image = pygame.image.load(f"{IMG_DIR}/spring.png").convert_alpha()
-            self.image = pygame.transform.scale(original_image, (20, 20))
-        elif type == "jetpack":
-            original_image = pygame.image.load(f"{IMG_DIR}/jetpack.png").convert_alpha()
-            self.image = pygame.transform.scale(original_image, (30, 30))
-        self.rect = self.image.get_rect(midbottom=(x, y))
-        self.pickup_sound = pygame.mixer.Sound(f"{SND_DIR}/powerup_pickup.wav")
-        self.pickup_sound.set_volume(0.5)
+        # "spring" (20x20) ou "jetpack" (30x30)
+        self.image = assets.image(type)
+        self.place_at("midbottom", (x, y))
         
     def apply_effect(self, player: 'Player') -> None:
-        self.pickup_sound.play()  # Aqui o som é tocado quando o power-up é coletado
+        player.sounds.play("powerup_pickup")  # Aqui o som é tocado quando o power-up é coletado
         player.powered_up = True  # Ativa o estado de power-up
         player.was_powered_up = True  # Marca que o jogador pegou um power-up
         if self.type == "spring":
@@ -125,33 +188,35 @@ class PowerUp(pygame.sprite.Sprite):
         elif self.type == "jetpack":
             player.jump(boost=3.0)  # Pulo muito mais alto
 
-class FlyingEnemy(pygame.sprite.Sprite):
-    def __init__(self, x: int, y: int) -> None:
+class FlyingEnemy(Entity):
+    def __init__(self, x: int, y: int, rng: random.Random = random) -> None:
         super().__init__()
-        # Carrega e redimensiona a imagem do inimigo voador (reduzido o tamanho)
-        try:
-            original_image = pygame.image.load(f"{IMG_DIR}/enemy_fly.png").convert_alpha()
-            self.image = pygame.transform.scale(original_image, (30, 20))  # Reduzido de 40x30 para 30x20
-        except:
-            # Fallback caso a imagem não exista
-            self.image = pygame.Surface((30, 20))  # Reduzido tamanho
-            self.image.fill((255, 0, 0))
-            pygame.draw.circle(self.image, (0, 0, 0), (15, 10), 4)  # Ajustado o círculo também
-            
-        self.rect = self.image.get_rect(center=(x, y))
+        # Imagem do inimigo voador (30x20); o registro de assets já cuida do fallback
+        self.image = assets.image("enemy_fly")
+        self.hitbox = None
+        self.rng = rng
+        self.reset(x, y)
+        
+    def reset(self, x: int, y: int, rng: random.Random = None) -> None:
+        if rng is not None:
+            self.rng = rng
+        self.place_at("center", (x, y))
         # Criando um hitbox menor (75% do tamanho original)
-        self.hitbox = pygame.Rect(0, 0, self.rect.width * 0.75, self.rect.height * 0.75)
+        if self.hitbox is None:
+            self.hitbox = pygame.Rect(0, 0, self.rect.width * 0.75, self.rect.height * 0.75)
         self.hitbox.center = self.rect.center
         
-        self.vx = random.choice([-2, -1, 1, 2])  # Velocidade horizontal aleatória
-        self.vy = random.uniform(-0.5, 0.5)  # Pequena flutuação vertical
+        self.vx = self.rng.choice([-2, -1, 1, 2])  # Velocidade horizontal aleatória
+        self.vy = self.rng.uniform(-0.5, 0.5)  # Pequena flutuação vertical
         
     def update(self) -> None:
+        self.prev_x, self.prev_y = self.x, self.y
         # Movimento horizontal
-        self.rect.x += self.vx
+        self.x += self.vx
         
         # Pequeno movimento vertical para simular voo
-        self.rect.y += self.vy
+        self.y += self.vy
+        self.sync_rect()
         
         # Atualizar a posição do hitbox para acompanhar a imagem
         self.hitbox.center = self.rect.center
@@ -163,5 +228,5 @@ class FlyingEnemy(pygame.sprite.Sprite):
             self.vx = abs(self.vx)
             
         # Inverter flutuação vertical em intervalos aleatórios
-        if random.random() < 0.02:
+        if self.rng.random() < 0.02:
             self.vy *= -1
@@ -0,0 +1,80 @@
+import os
+from collections import OrderedDict
+import pygame
+
+
+class TextRenderer:
+    """Cache de fontes por (face, tamanho) e cache LRU de textos já renderizados"""
+
+    def __init__(self, max_surfaces: int = 128) -> None:
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+        self.max_surfaces = max_surfaces
+        # Estatísticas do cache de superfícies
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, face: str, size: int) -> pygame.font.Font:
+        """Retorna a fonte (arquivo .ttf ou nome de fonte do sistema) criando-a só uma vez"""
+        key = (face, size)
+        font = self.fonts.get(key)
+        if font is None:
+            if face and os.path.exists(face):
+                font = pygame.font.Font(face, size)
+            else:
+                font = pygame.font.SysFont(face, size)
+            self.fonts[key] = font
+        return font
+
+    def render(self, text: str, face: str, size: int, color: tuple) -> pygame.Surface:
+        """Renderiza o texto (antialias) reaproveitando superfícies recentes"""
+        key = (text, face, size, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = self.font(face, size).render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+        return surface
+
+
+class ScoreHUD:
+    """Desenha "rótulo + número" a partir de uma faixa de dígitos pré-renderizada"""
+
+    def __init__(self, text: TextRenderer, face: str, size: int, color: tuple,
+                 label: str = "Pontuação: ") -> None:
+        self.label = text.render(label, face, size, color)
+        # Renderiza cada dígito separadamente e monta tudo numa faixa só
+        digits = [text.font(face, size).render(str(d), True, color) for d in range(10)]
+        width = sum(d.get_width() for d in digits)
+        height = max(d.get_height() for d in digits)
+        self.strip = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.areas = {}
+        x = 0
+        for d, surf in enumerate(digits):
+            self.strip.blit(surf, (x, 0))
+            self.areas[str(d)] = pygame.Rect(x, 0, surf.get_width(), height)
+            x += surf.get_width()
+
+    def measure(self, value: int, pos: tuple) -> pygame.Rect:
+        """Retângulo que o placar ocupará, sem desenhar"""
+        width = self.label.get_width() + sum(self.areas[ch].width for ch in str(value))
+        height = max(self.label.get_height(), self.strip.get_height())
+        return pygame.Rect(pos[0], pos[1], width, height)
+
+    def draw(self, screen: pygame.Surface, value: int, pos: tuple) -> pygame.Rect:
+        """Desenha o placar e retorna o retângulo ocupado"""
+        x, y = pos
+        screen.blit(self.label, (x, y))
+        x += self.label.get_width()
+        blits = []
+        for ch in str(value):
+            area = self.areas[ch]
+            blits.append((self.strip, (x, y), area))
+            x += area.width
+        screen.blits(blits, doreturn=False)
+        return self.measure(value, pos)
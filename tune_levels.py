@@ -0,0 +1,256 @@
+"""Simulação Monte Carlo para ajustar a geração de nível.
+
+Gera e joga milhares de partidas com semente em paralelo (um processo por
+núcleo, sem janela e sem som), com um bot simples, e resume:
+
+  - falhas de alcance: pares de plataformas consecutivas que o pulo normal
+    (-11 com GRAVITY) não alcança;
+  - causas de morte (queda, inimigo, tempo esgotado);
+  - pontuação e até onde as partidas chegam em cada nível de dificuldade.
+
+Exemplos:
+
+    python tune_levels.py --runs 2000
+    python tune_levels.py --runs 500 --set PLATFORM_GAP_MAX=90 --json relatorio.json
+"""
+import argparse
+import ast
+import json
+import multiprocessing
+import os
+import time
+from collections import Counter
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import settings
+from settings import SCREEN_WIDTH, GRAVITY, INPUT_LEFT, INPUT_RIGHT
+
+JUMP_SPEED = 11  # Impulso de Player.jump() sem power-up
+PLAYER_SPEED = 5  # Velocidade horizontal de Player.update()
+PLAYER_WIDTH = 40
+PLATFORM_WIDTH = 70
+LANDING_TOLERANCE = 10  # collision.landing_time: pousa se bottom <= top + 10
+
+# Constantes que --set pode mudar: as que chunks.py lê de settings a cada
+# chunk e as globais de level.py que _init_worker atualiza. As outras são
+# copiadas na importação por algum módulo (GRAVITY em sprites.py, o backend
+# padrão de Level...) e um --set delas não teria efeito.
+TUNABLE = ("PLATFORM_GAP_MIN", "PLATFORM_GAP_MAX", "PLATFORM_DRIFT", "SAFE_PLATFORMS",
+           "MOVING_CHANCE", "MOVING_MAX_SCREEN_Y", "BREAKING_CHANCE", "BREAKING_MAX_SCREEN_Y",
+           "POWERUP_CHANCE", "POWERUP_MAX_SCREEN_Y", "SPRING_CHANCE", "CHUNK_HEIGHT",
+           "DIFFICULTY_STEP", "ENEMY_BASE_CHANCE", "ENEMY_CHANCE_PER_LEVEL", "ENEMY_MAX_EXTRA_CHANCE")
+
+_game = None
+
+
+def parse_overrides(items: list) -> dict:
+    """Converte ["NOME=valor", ...] em {nome: valor} (só constantes de TUNABLE).
+
+    O valor é lido como literal do Python (90, 0.5, False, None, "dummy");
+    o que não for literal fica como texto.
+    """
+    overrides = {}
+    for item in items or []:
+        name, _, value = item.partition("=")
+        if not hasattr(settings, name):
+            raise SystemExit(f"constante desconhecida em settings.py: {name}")
+        if name not in TUNABLE:
+            raise SystemExit(f"{name} não pode ser ajustada por --set; ajustáveis: {', '.join(TUNABLE)}")
+        try:
+            overrides[name] = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            overrides[name] = value
+    return overrides
+
+
+def _init_worker(overrides: dict) -> None:
+    """Cria um Game headless por processo, com as constantes sobrescritas"""
+    global _game
+    import level
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+        if hasattr(level, name):
+            setattr(level, name, value)
+    from game import Game
+    level.Level.record_history = True
+    _game = Game(headless=True)
+
+
+def bot_policy(game) -> int:
+    """Mira a plataforma mais próxima: acima enquanto sobe, abaixo enquanto cai"""
+    player = game.player
+    rect = player.rect
+    if player.vy > 0:
+        candidates = [p for p in game.platforms if p.rect.top >= rect.bottom - LANDING_TOLERANCE]
+        key = lambda p: p.rect.top - rect.bottom
+    else:
+        candidates = [p for p in game.platforms if p.rect.top < rect.top]
+        key = lambda p: rect.top - p.rect.top
+    if not candidates:
+        return 0
+    target = min(candidates, key=lambda p: key(p) + abs(p.rect.centerx - rect.centerx) * 0.5)
+    dx = target.rect.centerx - rect.centerx
+    if dx < -PLAYER_SPEED:
+        return INPUT_LEFT
+    if dx > PLAYER_SPEED:
+        return INPUT_RIGHT
+    return 0
+
+
+def jump_windows() -> list:
+    """(quadros, altura dos pés) durante a descida de um pulo normal"""
+    windows = []
+    vy = -JUMP_SPEED
+    height = 0.0
+    frame = 0
+    while height > -1000:
+        frame += 1
+        vy += GRAVITY
+        height -= vy
+        if vy > 0:
+            windows.append((frame, height))
+        if frame > 400:
+            break
+    return windows
+
+
+def check_reachability(history: list) -> list:
+    """Pares consecutivos de plataformas que um pulo normal não alcança"""
+    windows = jump_windows()
+    failures = []
+    period = SCREEN_WIDTH + PLAYER_WIDTH  # O jogador atravessa as laterais
+    for (kind_a, xa, ya), (kind_b, xb, yb) in zip(history, history[1:]):
+        dy = ya - yb  # Quanto B está acima de A
+        distance = abs(xb - xa) % period
+        distance = min(distance, period - distance)
+        needed = max(0, distance - (PLATFORM_WIDTH + PLAYER_WIDTH) // 2 + 1)
+        reachable = False
+        for frame, height in windows:
+            # Pés entre o topo de B e 10 px abaixo dele, já descendo
+            if dy - LANDING_TOLERANCE <= height < dy and PLAYER_SPEED * frame >= needed:
+                reachable = True
+                break
+        if not reachable:
+            failures.append({"from": kind_a, "to": kind_b, "dy": dy, "dx": xb - xa})
+    return failures
+
+
+def play_one(args: tuple) -> dict:
+    """Joga uma partida com a semente dada e retorna as métricas"""
+    seed, max_frames = args
+    game = _game
+    game.reset(seed)
+    difficulty_frames = Counter()
+    while game.frame < max_frames:
+        if not game.step(bot_policy(game)):
+            break
+        difficulty_frames[game.level.difficulty] += 1
+    history = game.level.history
+    kinds = Counter(kind for kind, _, _ in history)
+    return {
+        "seed": seed,
+        "frames": game.frame,
+        "score": game.score,
+        "difficulty": game.level.difficulty,
+        "cause": game.death_cause or "timeout",
+        "platforms": dict(kinds),
+        "reach_failures": check_reachability(history),
+        "difficulty_frames": dict(difficulty_frames),
+    }
+
+
+def percentile(values: list, q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def summarize(results: list, elapsed: float, overrides: dict) -> dict:
+    scores = [r["score"] for r in results]
+    frames = sum(r["frames"] for r in results)
+    causes = Counter(r["cause"] for r in results)
+    max_difficulty = max((r["difficulty"] for r in results), default=0)
+    # Por nível de dificuldade: quantas partidas chegaram e quantas morreram nele
+    per_difficulty = []
+    for d in range(max_difficulty + 1):
+        reached = [r for r in results if r["difficulty"] >= d]
+        died = [r for r in reached if r["difficulty"] == d and r["cause"] != "timeout"]
+        per_difficulty.append({
+            "difficulty": d,
+            "reached": len(reached),
+            "deaths": len(died),
+            "death_rate": len(died) / len(reached) if reached else 0.0,
+            "causes": dict(Counter(r["cause"] for r in died)),
+        })
+    failures = [dict(f, seed=r["seed"]) for r in results for f in r["reach_failures"]]
+    kinds = Counter()
+    for r in results:
+        kinds.update(r["platforms"])
+    return {
+        "runs": len(results),
+        "overrides": overrides,
+        "elapsed_s": round(elapsed, 2),
+        "frames": frames,
+        "frames_per_s": round(frames / elapsed) if elapsed else 0,
+        "causes": dict(causes),
+        "score": {
+            "mean": round(sum(scores) / len(scores), 1) if scores else 0,
+            "p10": percentile(scores, 0.10),
+            "p50": percentile(scores, 0.50),
+            "p90": percentile(scores, 0.90),
+            "max": max(scores, default=0),
+        },
+        "per_difficulty": per_difficulty,
+        "platform_mix": dict(kinds),
+        "reach_failures": len(failures),
+        "reach_failure_examples": failures[:20],
+    }
+
+
+def print_report(report: dict) -> None:
+    print(f"Partidas: {report['runs']}  quadros: {report['frames']}  "
+          f"tempo: {report['elapsed_s']} s ({report['frames_per_s']} quadros/s)")
+    if report["overrides"]:
+        print(f"Constantes alteradas: {report['overrides']}")
+    total = max(1, report["runs"])
+    print("Causas de morte: " + ", ".join(f"{c} {n} ({n * 100 / total:.1f}%)" for c, n in report["causes"].items()))
+    s = report["score"]
+    print(f"Pontuação: média {s['mean']}  p10 {s['p10']}  p50 {s['p50']}  p90 {s['p90']}  máx {s['max']}")
+    print("Dificuldade  chegaram  mortes  taxa   causas")
+    for d in report["per_difficulty"]:
+        print(f"{d['difficulty']:>11}  {d['reached']:>8}  {d['deaths']:>6}  {d['death_rate']:5.1%}  {d['causes']}")
+    print(f"Tipos de plataforma: {report['platform_mix']}")
+    print(f"Falhas de alcance: {report['reach_failures']}")
+    for f in report["reach_failure_examples"][:5]:
+        print(f"  semente {f['seed']}: {f['from']} -> {f['to']} dy={f['dy']} dx={f['dx']}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Monte Carlo da geração de nível")
+    parser.add_argument("--runs", type=int, default=1000, help="número de partidas")
+    parser.add_argument("--seed", type=int, default=0, help="primeira semente")
+    parser.add_argument("--max-frames", type=int, default=20000, help="limite de quadros por partida")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="processos (padrão: todos os núcleos)")
+    parser.add_argument("--set", action="append", metavar="NOME=VALOR", help="sobrescreve uma constante da geração de nível (ver TUNABLE)")
+    parser.add_argument("--json", metavar="ARQUIVO", help="salva o relatório completo em JSON")
+    args = parser.parse_args()
+
+    overrides = parse_overrides(args.set)
+    jobs = [(seed, args.max_frames) for seed in range(args.seed, args.seed + args.runs)]
+    start = time.perf_counter()
+    with multiprocessing.Pool(args.workers, initializer=_init_worker, initargs=(overrides,)) as pool:
+        results = list(pool.imap_unordered(play_one, jobs, chunksize=max(1, len(jobs) // (args.workers * 8))))
+    elapsed = time.perf_counter() - start
+
+    results.sort(key=lambda r: r["seed"])
+    report = summarize(results, elapsed, overrides)
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()